@@ -7,8 +7,11 @@ Summary:
 This file compares the performance of different sorting algorithms for the
 same list of integers
 """
+import os
 import random
 import time
+from array import array
+from bisect import bisect_left, bisect_right
 
 start = time.time()
 
@@ -54,6 +57,166 @@ def partition(arr, low, high):
     arr[i + 1], arr[high] = arr[high], arr[i + 1]
     return i + 1
 
+#Using Intro Sort
+# intro_sort() and its helpers
+
+# Ranges this size or smaller are finished with insertion sort
+INSERTION_CUTOFF = 16
+# Ranges bigger than this use the ninther instead of median-of-three
+NINTHER_CUTOFF = 40
+
+"""
+Returns the index of the median of arr[a], arr[b] and arr[c].
+
+:param arr: the list as a parameter
+:param a: first index
+:param b: second index
+:param c: third index
+
+:return: the index holding the middle value
+"""
+def medianOfThree(arr, a, b, c):
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+"""
+Picks a pivot index for arr[low..high]. Small ranges use median-of-three,
+bigger ones use Tukey's ninther (the median of three medians of three),
+which keeps sorted, reversed and organ-pipe input from going quadratic.
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: ending index
+
+:return: the index of the chosen pivot
+"""
+def choosePivot(arr, low, high):
+    mid = (low + high) // 2
+    if high - low < NINTHER_CUTOFF:
+        return medianOfThree(arr, low, mid, high)
+    step = (high - low) // 8
+    return medianOfThree(arr,
+                         medianOfThree(arr, low, low + step, low + 2 * step),
+                         medianOfThree(arr, mid - step, mid, mid + step),
+                         medianOfThree(arr, high - 2 * step, high - step, high))
+
+"""
+Insertion sort on the range arr[low..high] only.
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: ending index
+"""
+def insertionSortRange(arr, low, high):
+    for i in range(low + 1, high + 1):
+        current = arr[i]
+        j = i - 1
+
+        while j >= low and arr[j] > current:
+            arr[j + 1] = arr[j]
+            j -= 1
+
+        arr[j + 1] = current
+
+"""
+Heap sort on the range arr[low..high] only, with an iterative sift-down.
+Used by intro_sort when partitioning keeps going badly, so the worst case
+stays O(n log n).
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: ending index
+"""
+def heapSortRange(arr, low, high):
+    n = high - low + 1
+
+    def siftDown(root, end):
+        item = arr[low + root]
+        child = 2 * root + 1
+        while child < end:
+            if child + 1 < end and arr[low + child] < arr[low + child + 1]:
+                child += 1
+            if arr[low + child] <= item:
+                break
+            arr[low + root] = arr[low + child]
+            root = child
+            child = 2 * root + 1
+        arr[low + root] = item
+
+    for start in range(n // 2 - 1, -1, -1):
+        siftDown(start, n)
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        siftDown(0, end)
+
+"""
+Sorts arr[low..high] in place with introsort. Takes the same arguments as
+quick_sort so it can be used in its place.
+
+There is no recursion: pending ranges are kept on an explicit stack, and
+the larger side of each partition is pushed while the smaller side is
+worked on, so the stack stays O(log n). Pivots come from choosePivot and
+are split with a Hoare partition, which copes well with repeated values.
+Ranges of cutoff items or fewer are finished with insertion sort, and a
+range that is still being split after 2*log2(n) levels is heap sorted.
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: ending index
+:param cutoff: largest range size left to insertion sort
+
+"""
+def intro_sort(arr, low, high, cutoff=INSERTION_CUTOFF):
+    if high - low < 1:
+        return
+    maxDepth = 2 * ((high - low + 1).bit_length() - 1)
+    stack = [(low, high, maxDepth)]
+
+    while stack:
+        lo, hi, depth = stack.pop()
+
+        while hi - lo >= cutoff:
+            if depth == 0:
+                heapSortRange(arr, lo, hi)
+                break
+            depth -= 1
+
+            # Move the pivot to the middle so the Hoare scan cannot run off
+            # either end and the split point is always below hi
+            mid = (lo + hi) // 2
+            p = choosePivot(arr, lo, hi)
+            arr[p], arr[mid] = arr[mid], arr[p]
+            pivot = arr[mid]
+
+            i = lo - 1
+            j = hi + 1
+            while True:
+                i += 1
+                while arr[i] < pivot:
+                    i += 1
+                j -= 1
+                while arr[j] > pivot:
+                    j -= 1
+                if i >= j:
+                    break
+                arr[i], arr[j] = arr[j], arr[i]
+
+            # arr[lo..j] <= pivot <= arr[j+1..hi]
+            if j - lo < hi - j - 1:
+                stack.append((j + 1, hi, depth))
+                hi = j
+            else:
+                stack.append((lo, j, depth))
+                lo = j + 1
+        else:
+            insertionSortRange(arr, lo, hi)
+
 #Bubble sort algorithm
 """
 Uses bubble sort to make the list sorted 
@@ -117,20 +280,608 @@ def selectionSort(arr):
 
     return arr
 
+#Radix sort and counting sort
+# Both only work on integers, but they never compare two items, so they are
+# not limited to O(n log n) like the sorts above
+
+# Radix sort looks at this many bits of each key per pass
+RADIX_BITS = 11
+# radixSort hands off to countingSort when max - min is under this times n
+COUNTING_RANGE_FACTOR = 2
+
+"""
+Using counting sort to make the list sorted. Counts how many times each
+value between the smallest and largest item appears, then writes the values
+back in order. Takes O(n + k) time and O(k) extra space where k is
+max - min + 1, so it is only worth it when k is not much bigger than n.
+
+:param arr: the list of integers as a parameter
+"""
+def countingSort(arr):
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    low = min(arr)
+    counts = [0] * (max(arr) - low + 1)
+    for item in arr:
+        counts[item - low] += 1
+
+    i = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[i:i + count] = [offset + low] * count
+            i += count
+
+    return arr
+
+"""
+Using LSD radix sort to make the list sorted. The smallest value is
+subtracted from every item first, so negative numbers work, and then the
+keys are distributed RADIX_BITS bits at a time starting from the lowest
+bits. Each pass is a stable counting pass, so after the last pass the list
+is in order. Takes O(d * (n + 2^RADIX_BITS)) time where d is the number of
+passes needed to cover max - min.
+
+The keys are held in two array('q') buffers that swap roles every pass, so
+no new list is built per pass. Items must be integers whose range
+max - min fits in a signed 64-bit integer. When the range is small next to
+n, countingSort is used instead because it needs only one pass.
+
+:param arr: the list of integers as a parameter
+"""
+def radixSort(arr):
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    low = min(arr)
+    span = max(arr) - low
+    if span < COUNTING_RANGE_FACTOR * n:
+        return countingSort(arr)
+
+    mask = (1 << RADIX_BITS) - 1
+    source = array('q', [item - low for item in arr])
+    scratch = array('q', bytes(source.itemsize * n))
+
+    for shift in range(0, span.bit_length(), RADIX_BITS):
+        counts = [0] * (mask + 1)
+        for key in source:
+            counts[(key >> shift) & mask] += 1
+
+        # Turn the counts into the first output position for each digit
+        position = 0
+        for digit, count in enumerate(counts):
+            counts[digit] = position
+            position += count
+
+        for key in source:
+            digit = (key >> shift) & mask
+            scratch[counts[digit]] = key
+            counts[digit] += 1
+
+        source, scratch = scratch, source
+
+    arr[:] = [key + low for key in source]
+    return arr
+
+#Natural merge sort
+# naturalMergeSort() and its helpers. Like timsort, it merges the runs that
+# are already in the list instead of splitting it in half blindly.
+# The helpers use half-open ranges: low is included, high is not.
+
+# Lists shorter than this are sorted with binary insertion sort alone
+MIN_MERGE = 64
+# How many wins in a row send a merge into galloping mode
+MIN_GALLOP = 7
+
+"""
+Works out the shortest run length for a list of n items. The result is
+between 32 and 64 and makes n / minRun a power of two or just under one,
+so the final merges stay balanced.
+
+:param n: the length of the list
+
+:return: the minimum run length
+"""
+def minRunLength(n):
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+"""
+Finds the run that starts at arr[low]. A non-descending run is left alone,
+a strictly descending run is reversed in place (strictly, so equal items
+never change order).
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: end of the list (not included)
+
+:return: the index just past the end of the run
+"""
+def countRun(arr, low, high):
+    run = low + 1
+    if run == high:
+        return high
+
+    if arr[run] < arr[low]:
+        run += 1
+        while run < high and arr[run] < arr[run - 1]:
+            run += 1
+        arr[low:run] = arr[low:run][::-1]
+    else:
+        run += 1
+        while run < high and arr[run] >= arr[run - 1]:
+            run += 1
+
+    return run
+
+"""
+Binary insertion sort on arr[low:high] where arr[low:start] is already
+sorted. Uses bisect to find each position and one slice move per item.
+
+:param arr: the list as a parameter
+:param low: starting index
+:param high: end of the range (not included)
+:param start: first index that is not sorted yet
+"""
+def binaryInsertionSort(arr, low, high, start):
+    for i in range(start, high):
+        item = arr[i]
+        pos = bisect_right(arr, item, low, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = item
+
+"""
+Galloping searches. They find the same index as bisect_left/bisect_right
+on the sorted range a[low:high], but first probe 1, 2, 4, 8... places in
+from one end, so finding a spot k places in costs O(log k) instead of
+O(log n). gallopLeft/gallopRight probe from low, the FromEnd versions
+from high.
+
+:param key: the value to look for
+:param a: the sorted list
+:param low: starting index
+:param high: end of the range (not included)
+
+:return: the insertion index
+"""
+def gallopLeft(key, a, low, high):
+    bound = low
+    step = 1
+    while bound < high and a[bound] < key:
+        low = bound + 1
+        bound += step
+        step *= 2
+    return bisect_left(a, key, low, min(bound, high))
+
+def gallopRight(key, a, low, high):
+    bound = low
+    step = 1
+    while bound < high and a[bound] <= key:
+        low = bound + 1
+        bound += step
+        step *= 2
+    return bisect_right(a, key, low, min(bound, high))
+
+def gallopLeftFromEnd(key, a, low, high):
+    bound = high - 1
+    step = 1
+    while bound >= low and a[bound] >= key:
+        high = bound
+        bound -= step
+        step *= 2
+    return bisect_left(a, key, max(bound + 1, low), high)
+
+def gallopRightFromEnd(key, a, low, high):
+    bound = high - 1
+    step = 1
+    while bound >= low and a[bound] > key:
+        high = bound
+        bound -= step
+        step *= 2
+    return bisect_right(a, key, max(bound + 1, low), high)
+
+"""
+Merges the sorted runs arr[low:mid] and arr[mid:high] when the left run is
+the shorter one. The left run is copied into tmp and the merge fills arr
+from the front. After one side wins minGallop times in a row, the merge
+switches to galloping and moves whole blocks at once until both sides
+start winning short blocks again.
+
+:param arr: the list as a parameter
+:param tmp: the reusable buffer, grown here if it is too short
+:param low: start of the left run
+:param mid: start of the right run
+:param high: end of the right run (not included)
+:param minGallop: current galloping threshold
+
+:return: the updated galloping threshold
+"""
+def mergeLow(arr, tmp, low, mid, high, minGallop):
+    lenA = mid - low
+    tmp[:lenA] = arr[low:mid]
+    i = 0
+    j = mid
+    k = low
+
+    while i < lenA and j < high:
+        countA = countB = 0
+        while i < lenA and j < high:
+            if arr[j] < tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                k += 1
+                countB += 1
+                countA = 0
+                if countB >= minGallop:
+                    break
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                k += 1
+                countA += 1
+                countB = 0
+                if countA >= minGallop:
+                    break
+
+        while i < lenA and j < high:
+            # Left items that are <= the next right item move together
+            count = gallopRight(arr[j], tmp, i, lenA) - i
+            if count:
+                arr[k:k + count] = tmp[i:i + count]
+                i += count
+                k += count
+                if i == lenA:
+                    break
+            # Right items that are < the next left item move together
+            count2 = gallopLeft(tmp[i], arr, j, high) - j
+            if count2:
+                arr[k:k + count2] = arr[j:j + count2]
+                j += count2
+                k += count2
+            if count < MIN_GALLOP and count2 < MIN_GALLOP:
+                minGallop += 1
+                break
+            minGallop = max(1, minGallop - 1)
+
+    # Whatever is left of the right run is already in place
+    arr[k:k + lenA - i] = tmp[i:lenA]
+    return minGallop
+
+"""
+Merges the sorted runs arr[low:mid] and arr[mid:high] when the right run is
+the shorter one. Works like mergeLow but copies the right run into tmp and
+fills arr from the back.
+
+:param arr: the list as a parameter
+:param tmp: the reusable buffer, grown here if it is too short
+:param low: start of the left run
+:param mid: start of the right run
+:param high: end of the right run (not included)
+:param minGallop: current galloping threshold
+
+:return: the updated galloping threshold
+"""
+def mergeHigh(arr, tmp, low, mid, high, minGallop):
+    tmp[:high - mid] = arr[mid:high]
+    i = mid
+    j = high - mid
+    k = high
+
+    while i > low and j > 0:
+        countA = countB = 0
+        while i > low and j > 0:
+            k -= 1
+            if tmp[j - 1] < arr[i - 1]:
+                i -= 1
+                arr[k] = arr[i]
+                countA += 1
+                countB = 0
+                if countA >= minGallop:
+                    break
+            else:
+                j -= 1
+                arr[k] = tmp[j]
+                countB += 1
+                countA = 0
+                if countB >= minGallop:
+                    break
+
+        while i > low and j > 0:
+            # Left items that are > the last right item move together
+            start = gallopRightFromEnd(tmp[j - 1], arr, low, i)
+            count = i - start
+            if count:
+                arr[k - count:k] = arr[start:i]
+                i = start
+                k -= count
+                if i == low:
+                    break
+            # Right items that are >= the last left item move together
+            start = gallopLeftFromEnd(arr[i - 1], tmp, 0, j)
+            count2 = j - start
+            if count2:
+                arr[k - count2:k] = tmp[start:j]
+                j = start
+                k -= count2
+            if count < MIN_GALLOP and count2 < MIN_GALLOP:
+                minGallop += 1
+                break
+            minGallop = max(1, minGallop - 1)
+
+    # Whatever is left of the left run is already in place
+    arr[k - j:k] = tmp[:j]
+    return minGallop
+
+"""
+Merges runs[index] with runs[index + 1]. Items at the start of the left
+run that are <= the first right item, and items at the end of the right
+run that are >= the last left item, are already in place and are trimmed
+off before the shorter of the two runs is copied out.
+
+:param arr: the list as a parameter
+:param tmp: the reusable buffer
+:param runs: the stack of (start, length) runs
+:param index: position of the left run on the stack
+:param minGallop: current galloping threshold
+
+:return: the updated galloping threshold
+"""
+def mergeAt(arr, tmp, runs, index, minGallop):
+    baseA, lenA = runs[index]
+    baseB, lenB = runs[index + 1]
+    runs[index] = (baseA, lenA + lenB)
+    del runs[index + 1]
+
+    low = gallopRight(arr[baseB], arr, baseA, baseB)
+    if low == baseB:
+        return minGallop
+    high = gallopLeftFromEnd(arr[baseB - 1], arr, baseB, baseB + lenB)
+
+    if baseB - low <= high - baseB:
+        return mergeLow(arr, tmp, low, baseB, high, minGallop)
+    return mergeHigh(arr, tmp, low, baseB, high, minGallop)
+
+"""
+Using an adaptive natural merge sort to make the list sorted. It is stable.
+
+The list is cut into the runs that are already in it (descending runs are
+flipped), and runs shorter than minRunLength are topped up with binary
+insertion sort. Runs go on a stack that is merged whenever the timsort
+length rules are broken, which keeps merges balanced. All merges share
+one temp buffer that never needs to hold more than half the list.
+
+An already sorted or reversed list is one run, so it takes O(n); any other
+list takes O(n log n), and fewer comparisons the more order it already has.
+
+:param arr: the list as a parameter
+"""
+def naturalMergeSort(arr):
+    n = len(arr)
+    if n < 2:
+        return arr
+    if n < MIN_MERGE:
+        binaryInsertionSort(arr, 0, n, countRun(arr, 0, n))
+        return arr
+
+    minRun = minRunLength(n)
+    tmp = []
+    runs = []
+    minGallop = MIN_GALLOP
+    low = 0
+
+    while low < n:
+        end = countRun(arr, low, n)
+        if end - low < minRun:
+            forced = min(low + minRun, n)
+            binaryInsertionSort(arr, low, forced, end)
+            end = forced
+        runs.append((low, end - low))
+        low = end
+
+        # Keep run lengths shrinking fast enough down the stack
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+               (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            minGallop = mergeAt(arr, tmp, runs, i, minGallop)
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        minGallop = mergeAt(arr, tmp, runs, i, minGallop)
+
+    return arr
+
+#Operation counters
+# Counted copies of partition, bubbleSort, insertionSort and selectionSort.
+# They do the same work as the plain versions but also count comparisons,
+# swaps and element writes into the counts dict. setCounting swaps the
+# module-level names between the two sets, so the plain sorts never check a
+# flag and cost nothing extra when counting is off. quick_sort calls
+# partition through the module name, so it is counted too.
+# Setting the environment variable SORT_COUNTERS=1 turns counting on when
+# this file is loaded.
+
+counts = {"comparisons": 0, "swaps": 0, "writes": 0}
+
+"""
+Sets every counter in counts back to zero.
+"""
+def resetCounts():
+    for key in counts:
+        counts[key] = 0
+
+"""
+partition() that also counts its comparisons, swaps and writes.
+"""
+def countedPartition(arr, low, high):
+    pivot = arr[high]
+    i = low - 1
+    swaps = 0
+
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+            swaps += 1
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    swaps += 1
+
+    counts["comparisons"] += high - low
+    counts["swaps"] += swaps
+    counts["writes"] += 2 * swaps
+    return i + 1
+
+"""
+bubbleSort() that also counts its comparisons, swaps and writes.
+"""
+def countedBubbleSort(arr):
+    n = len(arr)
+    comparisons = 0
+    swaps = 0
+
+    for k in range(n - 1):
+        swapped = False
+
+        for i in range(n - 1 - k):
+            comparisons += 1
+            if arr[i] > arr[i + 1]:
+                arr[i], arr[i + 1] = arr[i + 1], arr[i]
+                swaps += 1
+                swapped = True
+
+        if not swapped:
+            break
+
+    counts["comparisons"] += comparisons
+    counts["swaps"] += swaps
+    counts["writes"] += 2 * swaps
+    return arr
+
+"""
+insertionSort() that also counts its comparisons and writes. It shifts
+items instead of swapping them, so only writes go up.
+"""
+def countedInsertionSort(arr):
+    n = len(arr)
+    comparisons = 0
+    writes = 0
+
+    for i in range(1, n):
+        current = arr[i]
+        j = i - 1
+
+        while j >= 0:
+            comparisons += 1
+            if arr[j] <= current:
+                break
+            arr[j + 1] = arr[j]
+            writes += 1
+            j -= 1
+
+        arr[j + 1] = current
+        writes += 1
+
+    counts["comparisons"] += comparisons
+    counts["writes"] += writes
+    return arr
+
+"""
+selectionSort() that also counts its comparisons, swaps and writes.
+"""
+def countedSelectionSort(arr):
+    n = len(arr)
+    swaps = 0
+
+    for i in range(n - 1):
+        minIndex = i
+
+        for j in range(i + 1, n):
+            if arr[j] < arr[minIndex]:
+                minIndex = j
+
+        if minIndex != i:
+            arr[i], arr[minIndex] = arr[minIndex], arr[i]
+            swaps += 1
+
+    # The inner loop always runs n(n - 1) / 2 times in total
+    counts["comparisons"] += n * (n - 1) // 2
+    counts["swaps"] += swaps
+    counts["writes"] += 2 * swaps
+    return arr
+
+PLAIN_SORTS = {
+    "partition": partition,
+    "bubbleSort": bubbleSort,
+    "insertionSort": insertionSort,
+    "selectionSort": selectionSort,
+}
+
+COUNTED_SORTS = {
+    "partition": countedPartition,
+    "bubbleSort": countedBubbleSort,
+    "insertionSort": countedInsertionSort,
+    "selectionSort": countedSelectionSort,
+}
+
+# The sorts that report counts once counting is on
+COUNTED_ALGORITHMS = ("quick_sort", "bubbleSort", "insertionSort", "selectionSort")
+
+counting = False
+
+"""
+Turns operation counting on or off by rebinding partition, bubbleSort,
+insertionSort and selectionSort to the counted or plain versions.
+
+:param enabled: True to count, False for the plain sorts
+"""
+def setCounting(enabled):
+    global counting
+    globals().update(COUNTED_SORTS if enabled else PLAIN_SORTS)
+    counting = enabled
+
+if os.environ.get("SORT_COUNTERS") == "1":
+    setCounting(True)
+
+
 """
 Sample Output (your times may vary depending on computer speed):
 
 Quick Sort Time: 0.006 seconds
-Worst Case Time Complexity: O(n^2)
+Measured growth: n^1.18, best fit O(n log n)
+
+Intro Sort Time: 0.009 seconds
+Measured growth: n^1.12, best fit O(n log n)
 
 Bubble Sort Time: 2.16 seconds
-Worst Case Time Complexity: O(n^2)
+Measured growth: n^2.19, best fit O(n^2)
 
 Insertion Sort Time: 0.96 seconds
-Worst Case Time Complexity: O(n^2)
+Measured growth: n^2.09, best fit O(n^2)
 
 Selection Sort Time: 0.87 seconds
-Worst Case Time Complexity: O(n^2)
+Measured growth: n^2.00, best fit O(n^2)
+
+Radix Sort Time: 0.01 seconds
+Measured growth: n^0.69, best fit O(n)
+
+Natural Merge Sort Time: 0.03 seconds
+Measured growth: n^1.08, best fit O(n)
+
+The growth lines are fitted from timings at n = 250 to 4000 on this
+machine (see complexity_fit.py), so they also change from run to run.
 """
 
 
@@ -143,26 +894,65 @@ efficiently. However, this implementation can reach O(n^2) in the worst case
 because it always chooses the last element as the pivot. If the data is already
 sorted or nearly sorted, the partitions become very unbalanced.
 
+Intro sort fixes that worst case. It picks the pivot with median-of-three or
+the ninther, so sorted and reversed lists split evenly, and if the splits
+still go badly it switches to heap sort, so it stays O(n log n). It also uses
+a stack instead of recursion, so large sorted lists cannot hit the recursion
+limit the way quick_sort does.
+
 Bubble sort, insertion sort, and selection sort are all O(n^2) in the worst case,
 so they scale much worse as the list gets large. Bubble sort repeatedly compares
 adjacent items and can require many passes. Insertion sort shifts elements and is
 often faster than bubble sort, especially if the list is somewhat sorted. Selection
 sort always scans the remaining unsorted elements to find the minimum, so it does
 about the same number of comparisons no matter what the input looks like.
+
+Radix sort and counting sort are different because they never compare two
+items. The list here is integers from -200000 to 200000, so radix sort only
+needs two passes of 11 bits each, which is linear in n. Counting sort is one
+pass but needs a slot for every possible value, so it is used only when the
+range of values is small compared with the length of the list.
+
+Natural merge sort is built for lists that are already mostly in order. It
+merges the sorted runs that are already in the list, so a sorted list is a
+single run and takes O(n), and a list with a few items out of place only
+needs a few merges. On random data it is still O(n log n) like intro sort.
 """
 
 
 
 def main():
+    # Imported here because complexity_fit loads this file itself (as sorts)
+    import complexity_fit
+
     original = numbers  # original random list
 
+    # Measure how each sort grows on random lists instead of quoting Big-O
+    names = ["quick_sort", "intro_sort", "bubbleSort", "insertionSort",
+             "selectionSort", "radixSort", "naturalMergeSort"]
+    fits = complexity_fit.measureFits(names, distributions=["random"],
+                                      sizes=complexity_fit.geometricSizes(250, 2, 5),
+                                      budget=0.5)
+
+    def growth(name):
+        return complexity_fit.describe(fits.get((name, "random")))
+
     # Quick Sort
     arr = original.copy()
     start = time.time()
     quick_sort(arr, 0, len(arr) - 1)
     end = time.time()
     print("Quick Sort Time:", end - start, "seconds")
-    print("Worst Case Time Complexity: O(n^2)")
+    print(growth("quick_sort"))
+    print()
+
+    # Intro Sort
+    arr = original.copy()
+    start = time.time()
+    intro_sort(arr, 0, len(arr) - 1)
+    end = time.time()
+    print("Intro Sort Time:", end - start, "seconds")
+    print(growth("intro_sort"))
     print()
 
     # Bubble Sort
@@ -171,7 +961,7 @@ def main():
     bubbleSort(arr)
     end = time.time()
     print("Bubble Sort Time:", end - start, "seconds")
-    print("Worst Case Time Complexity: O(n^2)")
+    print(growth("bubbleSort"))
     print()
 
     # Insertion Sort
@@ -180,7 +970,7 @@ def main():
     insertionSort(arr)
     end = time.time()
     print("Insertion Sort Time:", end - start, "seconds")
-    print("Worst Case Time Complexity: O(n^2)")
+    print(growth("insertionSort"))
     print()
 
     # Selection Sort
@@ -189,7 +979,25 @@ def main():
     selectionSort(arr)
     end = time.time()
     print("Selection Sort Time:", end - start, "seconds")
-    print("Worst Case Time Complexity: O(n^2)")
+    print(growth("selectionSort"))
+    print()
+
+    # Radix Sort
+    arr = original.copy()
+    start = time.time()
+    radixSort(arr)
+    end = time.time()
+    print("Radix Sort Time:", end - start, "seconds")
+    print(growth("radixSort"))
+    print()
+
+    # Natural Merge Sort
+    arr = original.copy()
+    start = time.time()
+    naturalMergeSort(arr)
+    end = time.time()
+    print("Natural Merge Sort Time:", end - start, "seconds")
+    print(growth("naturalMergeSort"))
 
 
 if __name__ == '__main__':
@@ -7,6 +7,14 @@ Summary: Calculates exponent and time complexity using a loop and
 a recursive function
 """
 
+import operator
+from collections import OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 """
 re-engineered "pow" function using a loop; calculates the result of raising a number by a power
@@ -41,11 +49,494 @@ def expo_r(number, exponent):
         return number
     return number * expo_r(number, exponent - 1)
 
+"""
+exponentiation by squaring using a loop; O(log n) multiplications instead of O(n)
+
+Walks the bits of the exponent from the lowest up. The base is squared once
+per bit, and multiplied into the result when the bit is set.
+
+:param number: the base to be raised by.
+:param exponent: the non negative exponent to raise the base by.
+
+:return: the result of the base to the power of the exponent
+:raises ValueError: if the exponent is negative
+"""
+def expo_sq(number, exponent):
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    result = 1
+    square = number
+
+    while exponent:
+        if exponent & 1:
+            result *= square
+        exponent >>= 1
+        if exponent:
+            square *= square
+    return result
+
+
+"""
+recursive exponentiation by squaring; uses number^n = (number^(n//2))^2,
+times number once more when n is odd, so the recursion is only about
+log2(n) calls deep and will not hit the recursion limit
+
+:param number: the base to be raised by.
+:param exponent: the non negative exponent to raise the base by.
+
+:return: the result of the base to the power of the exponent
+:raises ValueError: if the exponent is negative
+"""
+def expo_sq_r(number, exponent):
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    if exponent == 0:
+        return 1
+    half = expo_sq_r(number, exponent // 2)
+    if exponent & 1:
+        return half * half * number
+    return half * half
+
+
+"""
+modular exponentiation by squaring; reduces after every multiplication so
+the numbers never grow past mod^2, which keeps big-int work small
+
+:param base: the integer base.
+:param exponent: the non negative exponent to raise the base by.
+:param mod: the positive modulus.
+
+:return: base to the power of exponent, modulo mod
+:raises ValueError: if the exponent is negative or mod is not positive
+"""
+def expo_mod(base, exponent, mod):
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    if mod <= 0:
+        raise ValueError("mod must be positive")
+    result = 1 % mod
+    square = base % mod
+
+    while exponent:
+        if exponent & 1:
+            result = result * square % mod
+        exponent >>= 1
+        if exponent:
+            square = square * square % mod
+    return result
+
+
+"""
+exponentiation by squaring for any associative multiply, such as matrix
+multiplication; the multiply does not need to be commutative
+
+:param base: the value to be raised.
+:param exponent: the non negative exponent to raise the base by.
+:param multiply: a function taking two values and returning their product.
+:param identity: the value x for which multiply(x, y) == y, used for exponent 0.
+
+:return: base multiplied by itself exponent times
+:raises ValueError: if the exponent is negative
+"""
+def expo_generic(base, exponent, multiply, identity):
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    result = identity
+    square = base
+
+    while exponent:
+        if exponent & 1:
+            result = multiply(result, square)
+        exponent >>= 1
+        if exponent:
+            square = multiply(square, square)
+    return result
+
+
+IDENTITY_2X2 = ((1, 0), (0, 1))
+
+"""
+multiplies two 2x2 matrices written as ((a, b), (c, d))
+
+:param a: the left matrix.
+:param b: the right matrix.
+
+:return: the matrix product a * b
+"""
+def mat_mult(a, b):
+    (a00, a01), (a10, a11) = a
+    (b00, b01), (b10, b11) = b
+    return ((a00 * b00 + a01 * b10, a00 * b01 + a01 * b11),
+            (a10 * b00 + a11 * b10, a10 * b01 + a11 * b11))
+
+
+"""
+n-th Fibonacci number from the matrix ((1, 1), (1, 0)) raised to n, using
+expo_generic, so only O(log n) matrix multiplications are needed
+
+:param n: the non negative index, fib(0) = 0 and fib(1) = 1.
+
+:return: the n-th Fibonacci number
+"""
+def fib(n):
+    return expo_generic(((1, 1), (1, 0)), n, mat_mult, IDENTITY_2X2)[0][1]
+
+
+# Largest modulus the NumPy batch path accepts, so that every product of two
+# reduced values still fits in an int64
+NUMPY_MOD_LIMIT = 2 ** 31
+
+"""
+checks whether expo_batch can use NumPy for these bases: floats without a
+modulus, or integers with a modulus small enough not to overflow int64
+
+:param bases: the bases, as a sequence or ndarray.
+:param mod: the modulus, or None.
+
+:return: the bases as an ndarray if NumPy can be used, otherwise None
+"""
+def _numpy_bases(bases, mod):
+    if numpy is None:
+        return None
+    array = numpy.asarray(bases)
+    if array.dtype.kind == "f" and mod is None:
+        return array.astype(numpy.float64)
+    if array.dtype.kind in "iu" and mod is not None and 0 < mod <= NUMPY_MOD_LIMIT:
+        return array.astype(numpy.int64) % mod
+    return None
+
+
+"""
+vectorized exponentiation by squaring; every step squares all the bases at
+once and multiplies the result only where the current exponent bit is set
+
+:param bases: the bases as a float64 or (already reduced) int64 ndarray.
+:param exponents: the non negative exponents, one per base.
+:param mod: the modulus for integer bases, or None.
+
+:return: an ndarray of results
+"""
+def _expo_batch_numpy(bases, exponents, mod):
+    exponents = numpy.array(exponents, dtype=numpy.int64)
+    if (exponents < 0).any():
+        raise ValueError("exponents must be non-negative")
+    squares = bases.copy()
+    results = numpy.ones_like(squares)
+    if mod is not None:
+        results %= mod
+
+    # Float results may overflow to inf, just like the loop versions do
+    with numpy.errstate(over="ignore"):
+        while exponents.any():
+            odd = (exponents & 1).astype(bool)
+            results[odd] *= squares[odd]
+            if mod is not None:
+                results[odd] %= mod
+            exponents >>= 1
+            squares *= squares
+            if mod is not None:
+                squares %= mod
+    return results
+
+
+"""
+batched exponentiation by squaring without NumPy; pairs are grouped by
+exponent so each exponent's squaring chain is decoded once, and every step
+is one map or list comprehension over all bases in the group
+
+:param bases: the bases.
+:param exponents: the non negative exponents, one per base.
+:param mod: the modulus, or None for exact results.
+
+:return: a list of results in the same order as the input
+"""
+def _expo_batch_python(bases, exponents, mod):
+    groups = {}
+    for index, exponent in enumerate(exponents):
+        if exponent < 0:
+            raise ValueError("exponents must be non-negative")
+        groups.setdefault(exponent, []).append(index)
+
+    results = [None] * len(exponents)
+    for exponent, indices in groups.items():
+        if mod is None:
+            squares = [bases[i] for i in indices]
+            values = None
+        else:
+            squares = [bases[i] % mod for i in indices]
+            values = [1 % mod] * len(indices)
+
+        while exponent:
+            if exponent & 1:
+                if mod is not None:
+                    values = [v * b % mod for v, b in zip(values, squares)]
+                elif values is None:
+                    # Start from the first square itself, not 1 * square,
+                    # so float and int bases keep their own type
+                    values = squares
+                else:
+                    values = list(map(operator.mul, values, squares))
+            exponent >>= 1
+            if exponent:
+                if mod is None:
+                    squares = list(map(operator.mul, squares, squares))
+                else:
+                    squares = [b * b % mod for b in squares]
+
+        if values is None:
+            values = [1] * len(indices)
+        for i, value in zip(indices, values):
+            results[i] = value
+    return results
+
+
+"""
+raises many bases to many exponents in one call
+
+Uses NumPy when it is installed and the results fit in fixed-size numbers:
+float bases without a modulus (a list with any float in it counts as
+floats), or integer bases with a modulus up to NUMPY_MOD_LIMIT.
+Everything else, including exact big-int results, goes through the grouped
+pure-Python path.
+
+:param bases: a sequence or ndarray of bases.
+:param exponents: a sequence or ndarray of non negative exponents, the same length.
+:param mod: an optional positive modulus.
+:param use_numpy: False to always use the pure-Python path.
+
+:return: an ndarray from the NumPy path, otherwise a list, in input order
+:raises ValueError: if the lengths differ, an exponent is negative or mod is not positive
+"""
+def expo_batch(bases, exponents, mod=None, use_numpy=True):
+    if len(bases) != len(exponents):
+        raise ValueError("bases and exponents must have the same length")
+    if mod is not None and mod <= 0:
+        raise ValueError("mod must be positive")
+
+    array = _numpy_bases(bases, mod) if use_numpy else None
+    if array is not None:
+        return _expo_batch_numpy(array, exponents, mod)
+    if numpy is not None:
+        if isinstance(bases, numpy.ndarray):
+            bases = bases.tolist()
+        if isinstance(exponents, numpy.ndarray):
+            exponents = exponents.tolist()
+    return _expo_batch_python(bases, exponents, mod)
+
+
+"""
+reads a number written as an integer if it is one, otherwise as a float
+
+:param text: the number as text.
+
+:return: an int or a float
+"""
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+"""
+streams results for a file with one "base exponent" pair per line, working
+through it batch_size pairs at a time so the whole file is never in memory;
+blank lines are skipped
+
+:param path: the file of pairs.
+:param mod: an optional positive modulus.
+:param batch_size: how many pairs to evaluate per expo_batch call.
+
+:return: a generator of results in file order
+"""
+def expo_batch_file(path, mod=None, batch_size=65536):
+    bases = []
+    exponents = []
+    with open(path) as file:
+        for line in file:
+            fields = line.split()
+            if not fields:
+                continue
+            bases.append(_parse_number(fields[0]))
+            exponents.append(int(fields[1]))
+            if len(bases) == batch_size:
+                yield from expo_batch(bases, exponents, mod)
+                bases = []
+                exponents = []
+    if bases:
+        yield from expo_batch(bases, exponents, mod)
+
+
+class FixedBaseExponentiator(object):
+    """Raises a few bases to many different exponents, reusing a table of
+    precomputed powers for each base.
+
+    The exponent is read in windows of `window` bits. Row j of a base's
+    table holds base^(d * 2^(window * j)) for every digit d from 1 to
+    2^window - 1, so a power is just the product of one table entry per
+    nonzero digit: no squarings at all, and only (nonzero digits - 1)
+    multiplications. Rows are added when a larger exponent needs them.
+
+    Tables are kept for at most max_bases bases in least recently used
+    order. The counters compare the multiplications actually done (table
+    building included) with what expo_sq and expo would have needed.
+    Without a modulus the table entries are big ints that grow with the
+    exponent, so the saving in memory traffic is best with a modulus."""
+
+    DEFAULT_WINDOW = 4
+    DEFAULT_MAX_BASES = 32
+    # report() only compares with expo while its total multiplication count
+    # is at most this; past it, expo is no real alternative to compare with
+    LOOP_REPORT_LIMIT = 10 ** 9
+
+    def __init__(self, window=DEFAULT_WINDOW, max_bases=DEFAULT_MAX_BASES, mod=None):
+        """Sets up an empty cache. mod is an optional positive modulus
+        applied to every result."""
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if max_bases < 1:
+            raise ValueError("max_bases must be at least 1")
+        if mod is not None and mod <= 0:
+            raise ValueError("mod must be positive")
+        self.window = window
+        self.max_bases = max_bases
+        self.mod = mod
+        self._tables = OrderedDict()
+        self.clear_stats()
+
+    def clear_stats(self):
+        """Resets every counter to zero, but keeps the cached tables."""
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_entries = 0
+        self.table_multiplications = 0
+        self.power_multiplications = 0
+        self.squaring_multiplications = 0
+        self.loop_multiplications = 0
+
+    def clear(self):
+        """Drops every cached table."""
+        self._tables.clear()
+
+    def __len__(self):
+        """Returns the number of bases with a cached table."""
+        return len(self._tables)
+
+    def _multiply(self, a, b):
+        """Returns a * b, reduced by the modulus if there is one."""
+        if self.mod is None:
+            return a * b
+        return a * b % self.mod
+
+    def _table(self, base):
+        """Returns the table for base, making it the most recently used
+        and evicting the least recently used one if the cache is full."""
+        # Keyed by type too, so 2 and 2.0 get their own tables
+        key = (type(base), base)
+        table = self._tables.get(key)
+        if table is not None:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return table
+
+        self.misses += 1
+        if len(self._tables) >= self.max_bases:
+            _, old = self._tables.popitem(last=False)
+            self.evictions += 1
+            self.evicted_entries += sum(len(row) - 1 for row in old)
+        table = []
+        self._tables[key] = table
+        return table
+
+    def _add_row(self, table, base):
+        """Appends the next row to a table. Row j starts from
+        base^(2^(window * j)), which is the last row's top entry times its
+        first entry."""
+        if table:
+            last = table[-1]
+            step = self._multiply(last[-1], last[1])
+            self.table_multiplications += 1
+        else:
+            step = base if self.mod is None else base % self.mod
+
+        # Entry 0 is never used; it keeps the digit equal to the index
+        row = [None, step]
+        for _ in range((1 << self.window) - 2):
+            row.append(self._multiply(row[-1], step))
+        self.table_multiplications += (1 << self.window) - 2
+        table.append(row)
+
+    def power(self, base, exponent):
+        """Returns base to the power of exponent, modulo mod if it was
+        given. Raises ValueError if the exponent is negative."""
+        if exponent < 0:
+            raise ValueError("exponent must be non-negative")
+        self.calls += 1
+        table = self._table(base)
+        rows = -(-exponent.bit_length() // self.window)
+        while len(table) < rows:
+            self._add_row(table, base)
+
+        if exponent:
+            self.squaring_multiplications += exponent.bit_length() - 1 + bin(exponent).count("1")
+            self.loop_multiplications += exponent
+
+        mask = (1 << self.window) - 1
+        result = None
+        j = 0
+        while exponent:
+            digit = exponent & mask
+            if digit:
+                if result is None:
+                    result = table[j][digit]
+                else:
+                    result = self._multiply(result, table[j][digit])
+                    self.power_multiplications += 1
+            exponent >>= self.window
+            j += 1
+
+        if result is None:
+            return 1 if self.mod is None else 1 % self.mod
+        return result
+
+    def hit_rate(self):
+        """Returns the fraction of calls that found their base cached."""
+        if not self.calls:
+            return 0.0
+        return self.hits / self.calls
+
+    def multiplications(self):
+        """Returns every multiplication done so far, table building included."""
+        return self.table_multiplications + self.power_multiplications
+
+    def report(self):
+        """Returns the cache and multiplication counters as a short report.
+        The saving against expo is left out once expo would have needed more
+        than LOOP_REPORT_LIMIT multiplications, as with large exponents."""
+        done = self.multiplications()
+        text = ("calls: %d\nhit rate: %.1f%% (%d hits, %d misses)\n"
+                "cached bases: %d of %d\nevictions: %d (%d table entries dropped)\n"
+                "multiplications: %d (%d building tables, %d in powers)\n"
+                "saved vs expo_sq: %d of %d (%.2fx fewer)" % (
+                    self.calls, 100 * self.hit_rate(), self.hits, self.misses,
+                    len(self), self.max_bases, self.evictions, self.evicted_entries,
+                    done, self.table_multiplications, self.power_multiplications,
+                    self.squaring_multiplications - done, self.squaring_multiplications,
+                    self.squaring_multiplications / (done or 1)))
+        if self.loop_multiplications <= self.LOOP_REPORT_LIMIT:
+            text += "\nsaved vs expo: %d of %d" % (
+                self.loop_multiplications - done, self.loop_multiplications)
+        return text
+
+
 """
 Main program.
 
-Takes user input and tests the loop and recursive methods.
-prints error if the user inputted exponent is a negative number
+Takes user input and tests the squaring, loop and recursive methods.
+prints error if the user inputted exponent is a negative number, and
+reports it on its own line when the exponent is too large for expo_r
 """
 def main():
     num = float(input("Enter a number "))
@@ -54,7 +545,15 @@ def main():
     if exp < 0:
         print("Error: non-negative exponent")
     else:
-        print("\nRecursive Result:", expo_r(num, exp))
+        # The squaring results come first, since expo_r recurses once per
+        # unit of the exponent and cannot finish for large ones
+        print("\nSquaring Result:", expo_sq(num, exp))
+        print("Recursive Squaring Result:", expo_sq_r(num, exp))
+        print("Time Complexity (both): O(log n)")
+        try:
+            print("\nRecursive Result:", expo_r(num, exp))
+        except RecursionError:
+            print("\nRecursive Result: exponent too large for recursion")
         print("exponent Result:", expo(num, exp))
         print("Time Complexity (both): O(n)")
 
@@ -0,0 +1,65 @@
+"""
+Name: Neel Srivastava
+Project: Array-based stack
+Date: 18/10/26
+Summary: An ArrayStack with the same methods as the one in Lambert's
+textbook (push, pop, peek, isEmpty, len, iter, clear). The items are kept
+in a Python list, which is itself a dynamic array, so push and pop are
+amortized O(1) and the top of the stack is the end of the list.
+"""
+
+
+class ArrayStack(object):
+    """An array-based stack implementation."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, sourceCollection=None):
+        """Sets the initial state of self, which includes the
+        contents of sourceCollection, if it's present."""
+        self._items = []
+        if sourceCollection:
+            for item in sourceCollection:
+                self.push(item)
+
+    # Accessor methods
+    def isEmpty(self):
+        """Returns True if len(self) == 0, or False otherwise."""
+        return not self._items
+
+    def __len__(self):
+        """Returns the number of items in self."""
+        return len(self._items)
+
+    def __iter__(self):
+        """Supports iteration over a view of self, from bottom to top."""
+        return iter(list(self._items))
+
+    def __str__(self):
+        """Returns the string representation of self, bottom first."""
+        return "[" + ", ".join(map(str, self._items)) + "]"
+
+    def peek(self):
+        """Returns the item at the top of the stack.
+        Precondition: the stack is not empty.
+        Raises: KeyError if the stack is empty."""
+        if not self._items:
+            raise KeyError("The stack is empty")
+        return self._items[-1]
+
+    # Mutator methods
+    def clear(self):
+        """Makes self become empty."""
+        self._items = []
+
+    def push(self, item):
+        """Inserts item at top of the stack."""
+        self._items.append(item)
+
+    def pop(self):
+        """Removes and returns the item at the top of the stack.
+        Precondition: the stack is not empty.
+        Raises: KeyError if the stack is empty."""
+        if not self._items:
+            raise KeyError("The stack is empty")
+        return self._items.pop()
@@ -0,0 +1,227 @@
+"""
+Name: Neel Srivastava
+Project: Empirical complexity fitter
+Date: 18/10/26
+Summary: Measures how the sorting algorithms actually grow instead of
+quoting their Big-O. Each algorithm runs over a geometric sweep of sizes
+(through sort_benchmark, so every sweep is in its own process and stops at
+the time budget), then a straight line is fitted to log(time) against
+log(n). The slope is the measured exponent. The n, n log n and n^2 models
+are also compared, and the one that fits best is reported. When the best
+model is worse than the one expected for that algorithm, or the sweep fails
+(like quick_sort hitting the recursion limit on sorted input), the result is
+flagged as a regression.
+
+Usage:
+    python complexity_fit.py --start 250 --factor 2 --steps 6 --metric time
+"""
+
+import argparse
+import math
+
+import sort_benchmark
+
+
+MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n^2": lambda n: n * n,
+}
+
+# Order of the models from slowest growing to fastest
+MODEL_ORDER = ("n", "n log n", "n^2")
+
+# The model each algorithm should fit on any input
+EXPECTED = {
+    "quick_sort": "n log n",
+    "intro_sort": "n log n",
+    "bubbleSort": "n^2",
+    "insertionSort": "n^2",
+    "selectionSort": "n^2",
+    "radixSort": "n",
+    "countingSort": "n",
+    "naturalMergeSort": "n log n",
+    "parallelSort": "n log n",
+    "np.quicksort": "n log n",
+    "np.stable": "n log n",
+    "np.heapsort": "n log n",
+    "np.partitionSort": "n log n",
+    "np.radixSort": "n",
+}
+
+METRICS = ("time", "comparisons", "swaps", "writes")
+
+DEFAULT_START = 250
+DEFAULT_FACTOR = 2
+DEFAULT_STEPS = 6
+
+# A fit needs at least this many sizes
+MIN_POINTS = 3
+
+
+def geometricSizes(start=DEFAULT_START, factor=DEFAULT_FACTOR, steps=DEFAULT_STEPS):
+    """
+    Returns steps sizes that start at start and grow by factor each step.
+
+    :return: A list of integer sizes.
+    """
+    return [int(round(start * factor ** i)) for i in range(steps)]
+
+
+def fitExponent(ns, values):
+    """
+    Fits log(value) = k * log(n) + c by least squares.
+
+    :param ns: The sizes.
+    :param values: The measured time or count for each size, all above zero.
+    :return: The slope k, which is the measured growth exponent.
+    """
+    xs = [math.log(n) for n in ns]
+    ys = [math.log(value) for value in values]
+    meanX = sum(xs) / len(xs)
+    meanY = sum(ys) / len(ys)
+    spread = sum((x - meanX) ** 2 for x in xs)
+    return sum((x - meanX) * (y - meanY) for x, y in zip(xs, ys)) / spread
+
+
+def bestModel(ns, values):
+    """
+    Finds the model f in MODELS for which value = c * f(n) fits best.
+
+    The constant c is fitted in log space, so each model is scored by how
+    much log(value / f(n)) varies across the sizes.
+
+    :param ns: The sizes, all at least 2.
+    :param values: The measured time or count for each size, all above zero.
+    :return: The name of the best model.
+    """
+    scores = {}
+    for name, model in MODELS.items():
+        residuals = [math.log(value / model(n)) for n, value in zip(ns, values)]
+        mean = sum(residuals) / len(residuals)
+        scores[name] = sum((r - mean) ** 2 for r in residuals)
+    return min(MODEL_ORDER, key=lambda name: scores[name])
+
+
+def fitRows(rows, metric="time"):
+    """
+    Fits every (algorithm, distribution) sweep in a set of benchmark rows.
+
+    :param rows: Result rows from sort_benchmark.runBenchmark.
+    :param metric: "time" to fit the minimum time, or an operation count.
+    :return: A dict from (algorithm, distribution) to a fit dict with
+             points, exponent, model, expected, status and regression keys.
+    """
+    sweeps = {}
+    for row in rows:
+        sweeps.setdefault((row["algorithm"], row["distribution"]), []).append(row)
+
+    fits = {}
+    for key, sweep in sweeps.items():
+        algorithm = key[0]
+        column = "min" if metric == "time" else metric
+        points = [(row["n"], row[column]) for row in sweep
+                  if row["status"] == "ok" and row["n"] >= 2 and row.get(column)]
+        errors = [row["status"] for row in sweep
+                  if row["status"] not in ("ok", "skipped")]
+
+        fit = {"points": len(points), "exponent": None, "model": None,
+               "expected": EXPECTED.get(algorithm), "status": "ok",
+               "regression": False}
+        if errors:
+            fit["status"] = errors[0]
+            fit["regression"] = True
+        if len(points) >= MIN_POINTS:
+            ns = [n for n, _ in points]
+            values = [value for _, value in points]
+            fit["exponent"] = fitExponent(ns, values)
+            fit["model"] = bestModel(ns, values)
+            if fit["expected"] and \
+               MODEL_ORDER.index(fit["model"]) > MODEL_ORDER.index(fit["expected"]):
+                fit["regression"] = True
+        elif not errors:
+            fit["status"] = "too few sizes"
+        fits[key] = fit
+    return fits
+
+
+def measureFits(algorithms=None, distributions=sort_benchmark.DISTRIBUTIONS,
+                sizes=None, metric="time", repeats=3,
+                budget=sort_benchmark.DEFAULT_BUDGET,
+                timeout=sort_benchmark.DEFAULT_TIMEOUT, seed=0):
+    """
+    Runs the benchmark over a geometric sweep and fits the results.
+
+    :return: The dict returned by fitRows.
+    """
+    if sizes is None:
+        sizes = geometricSizes()
+    rows = sort_benchmark.runBenchmark(algorithms, distributions, sizes, repeats,
+                                       budget, timeout, seed,
+                                       counts=metric != "time", verbose=False)
+    return fitRows(rows, metric)
+
+
+def describe(fit):
+    """
+    Returns a one-line summary of a fit, for example
+    "Measured growth: n^1.98, best fit O(n^2)".
+    """
+    if fit is None:
+        return "Measured growth: not measured"
+    if fit["exponent"] is None:
+        return "Measured growth: unknown (" + fit["status"] + ")"
+    text = "Measured growth: n^%.2f, best fit O(%s)" % (fit["exponent"], fit["model"])
+    if fit["regression"]:
+        text += "  REGRESSION (expected O(%s))" % fit["expected"]
+    return text
+
+
+def formatFits(fits):
+    """Returns all fits as a table with a header line."""
+    header = "%-16s %-14s %6s %9s %-9s %-9s  %s" % (
+        "algorithm", "distribution", "points", "exponent", "best fit", "expected", "status")
+    lines = [header, "-" * len(header)]
+    for (algorithm, distribution), fit in fits.items():
+        exponent = "-" if fit["exponent"] is None else "%.2f" % fit["exponent"]
+        status = fit["status"]
+        if fit["regression"]:
+            status += "  REGRESSION"
+        lines.append("%-16s %-14s %6d %9s %-9s %-9s  %s" % (
+            algorithm, distribution, fit["points"], exponent, fit["model"] or "-",
+            fit["expected"] or "-", status))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Parses the command line, runs the sweep, and prints the fitted exponents.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Measure how the 3.4.py sorts grow with n.")
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(sort_benchmark.ALGORITHMS),
+                        default=sort_benchmark.availableAlgorithms())
+    parser.add_argument("--distributions", nargs="+", choices=sort_benchmark.DISTRIBUTIONS,
+                        default=list(sort_benchmark.DISTRIBUTIONS))
+    parser.add_argument("--start", type=int, default=DEFAULT_START)
+    parser.add_argument("--factor", type=float, default=DEFAULT_FACTOR)
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument("--metric", choices=METRICS, default="time",
+                        help="fit the minimum time or one of the operation counts")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=sort_benchmark.DEFAULT_BUDGET)
+    parser.add_argument("--timeout", type=float, default=sort_benchmark.DEFAULT_TIMEOUT)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sizes = geometricSizes(args.start, args.factor, args.steps)
+    fits = measureFits(args.algorithms, args.distributions, sizes, args.metric,
+                       args.repeats, args.budget, args.timeout, args.seed)
+    print("Sizes:", ", ".join(str(n) for n in sizes))
+    print(formatFits(fits))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,32 @@ Date: 12/3/26
 Summary: Converts infix expressions to postfix form using a stack.
 Operators are held on the stack until a lower precedence operator
 or end of expression forces them to the output.
+
+Run with no arguments at a terminal for the interactive prompt. Given a
+file, or with stdin redirected, it converts one expression per line in
+bulk: lines are read in chunks, chunks are spread over a process pool and
+written back in input order, a bad line is reported on stderr (its output
+line is left blank) without stopping the run, and lines/s and tokens/s are
+printed at the end.
+
+With --stream the whole input is one expression instead, read in chunks
+and written out as the postfix tokens are released, so expressions larger
+than memory can be converted.
+
+Usage:
+    python converter.py expressions.txt -o postfix.txt --workers 4
+    python converter.py < expressions.txt > postfix.txt
+    python converter.py huge_expression.txt --stream -o postfix.txt
 """
 
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+
 from tokens import Token
-from scanner import Scanner
+from scanner import DEFAULT_CHUNK_SIZE, Scanner, StreamScanner
 from arraystack import ArrayStack
 
 
@@ -23,46 +45,222 @@ class IFToPFConverter(object):
         """
         self.scanner = scanner
 
-    def convert(self):
+    def iter_convert(self):
         """
-        Reads tokens one at a time and builds the postfix output using a stack.
-        Integers are appended directly to output, while operators are pushed onto
-        the stack and popped when a lower or equal precedence operator is encountered.
+        Reads tokens one at a time and yields the postfix output as the stack
+        releases it. Integers and variables are yielded straight away, while
+        operators are pushed onto the stack and popped when a lower or equal
+        precedence operator is encountered (only a lower one for the
+        right-associative ^). Tokens are compared by their integer kind and
+        precedence, so each token costs O(1) amortized work, and with a
+        StreamScanner the only memory that grows is the operator stack.
+
+        Operands and operators must alternate: expectOperand is True at the
+        start, after '(' and after an operator, and False after an operand
+        or ')'. A token that breaks that order is an error, so "+ 1 2",
+        "1 2 +" and "( )" are rejected rather than converted.
 
         :param: None
-        :return: A list of Token objects representing the postfix form of the infix expression.
+        :return: A generator of Token objects in postfix order.
+        :raises ValueError: If the parentheses do not match, or an operand
+                            or operator is missing.
         """
-        postfix = []
         stack = ArrayStack()
+        expectOperand = True
+        seenToken = False
 
-        while self.scanner.hasNext():
-            currentToken = self.scanner.next()
+        for currentToken in self.scanner:
+            kind = currentToken.kind
+            seenToken = True
 
-            if currentToken.getType() == Token.INT:
-                postfix.append(currentToken)
+            if kind <= Token.LAST_OPERAND:
+                if not expectOperand:
+                    raise ValueError("missing operator before %s" % currentToken)
+                expectOperand = False
+                yield currentToken
 
-            elif str(currentToken) == '(':
+            elif kind == Token.LPAR:
+                if not expectOperand:
+                    raise ValueError("missing operator before '('")
                 stack.push(currentToken)
 
-            elif str(currentToken) == ')':
-                while str(stack.peek()) != '(':
-                    postfix.append(stack.pop())
+            elif kind == Token.RPAR:
+                if expectOperand:
+                    raise ValueError("missing operand before ')'")
+                while not stack.isEmpty() and stack.peek().kind != Token.LPAR:
+                    yield stack.pop()
+                if stack.isEmpty():
+                    raise ValueError("unmatched ')'")
                 stack.pop()
 
             else:
-                while not stack.isEmpty() and \
-                      str(stack.peek()) != '(' and \
-                      stack.peek().getPrecedence() >= currentToken.getPrecedence():
-                    postfix.append(stack.pop())
+                if expectOperand:
+                    raise ValueError("missing operand before %s" % currentToken)
+                expectOperand = True
+                # '(' has precedence 0, so it is never popped here
+                limit = currentToken.precedence + currentToken.rightAssoc
+                while not stack.isEmpty() and stack.peek().precedence >= limit:
+                    yield stack.pop()
                 stack.push(currentToken)
 
+        if seenToken and expectOperand:
+            raise ValueError("missing operand at end of expression")
         while not stack.isEmpty():
-            postfix.append(stack.pop())
+            token = stack.pop()
+            if token.kind == Token.LPAR:
+                raise ValueError("unmatched '('")
+            yield token
+
+    def convert(self):
+        """
+        Converts the whole expression at once.
+
+        :param: None
+        :return: A list of Token objects representing the postfix form of the infix expression.
+        :raises ValueError: If the parentheses do not match, or an operand
+                            or operator is missing.
+        """
+        return list(self.iter_convert())
+
+
+# Lines sent to a worker at a time
+DEFAULT_CHUNK_LINES = 2000
+# Bytes buffered by the bulk reader and writer
+IO_BUFFER = 1024 * 1024
+
+
+def convertLine(line):
+    """
+    Converts one infix expression to postfix text.
+
+    :param line: The infix expression, possibly with a trailing newline.
+    :return: A (postfix text, token count, error message or None) tuple.
+             Blank lines give ("", 0, None).
+    """
+    try:
+        scanner = Scanner(line)
+        tokenCount = len(scanner)
+        postfix = IFToPFConverter(scanner).convert()
+    except ValueError as error:
+        return "", 0, str(error)
+    return " ".join(map(str, postfix)), tokenCount, None
+
+
+def _convertChunk(lines):
+    """Worker body: converts a list of lines."""
+    return [convertLine(line) for line in lines]
+
+
+def readChunks(inputFile, chunkLines=DEFAULT_CHUNK_LINES):
+    """
+    Reads a file chunkLines lines at a time.
+
+    :param inputFile: An open text file.
+    :param chunkLines: Lines per chunk.
+    :return: A generator of lists of lines.
+    """
+    chunk = []
+    for line in inputFile:
+        chunk.append(line)
+        if len(chunk) == chunkLines:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BulkStats(object):
+    """Counters for one bulk conversion run."""
+
+    def __init__(self):
+        self.lines = 0
+        self.tokens = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        """Returns the counters and the throughput as a short report."""
+        seconds = self.seconds or 1e-9
+        return ("lines: %d (%d errors)\ntokens: %d\nseconds: %.3f\n"
+                "lines/s: %.0f\ntokens/s: %.0f" % (
+                    self.lines, self.errors, self.tokens, self.seconds,
+                    self.lines / seconds, self.tokens / seconds))
 
-        return postfix
 
+def convertStream(inputFile, outputFile, errorFile=sys.stderr, workers=1,
+                  chunkLines=DEFAULT_CHUNK_LINES):
+    """
+    Converts every line of inputFile and writes the postfix lines to
+    outputFile in the same order.
+
+    :param inputFile: An open text file of infix expressions, one per line.
+    :param outputFile: An open text file for the postfix expressions.
+    :param errorFile: Where "line N: message" is written for each bad line.
+    :param workers: Processes to use; 1 converts in this process.
+    :param chunkLines: Lines per chunk handed to a worker.
+    :return: A BulkStats.
+    """
+    stats = BulkStats()
+    start = time.perf_counter()
+    chunks = readChunks(inputFile, chunkLines)
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        if pool is None:
+            results = map(_convertChunk, chunks)
+        else:
+            # imap hands back the chunks in the order they were read
+            results = pool.imap(_convertChunk, chunks)
+        for chunk in results:
+            lines = []
+            for postfix, tokenCount, error in chunk:
+                stats.lines += 1
+                stats.tokens += tokenCount
+                if error is not None:
+                    stats.errors += 1
+                    errorFile.write("line %d: %s\n" % (stats.lines, error))
+                lines.append(postfix)
+            lines.append("")
+            outputFile.write("\n".join(lines))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def convertStreaming(inputFile, outputFile, chunkSize=DEFAULT_CHUNK_SIZE,
+                     batchTokens=65536):
+    """
+    Converts one expression, however long, from inputFile to outputFile.
+    The input is scanned chunk by chunk and the postfix tokens are written
+    out batchTokens at a time as they are released, so memory stays bounded
+    by the operator stack rather than by the expression.
 
-def main():
+    :param inputFile: An open text file holding one infix expression.
+    :param outputFile: An open text file for the postfix expression.
+    :param chunkSize: Characters read at a time.
+    :param batchTokens: Tokens joined per write.
+    :return: The number of postfix tokens written.
+    :raises ValueError: If the expression is malformed; the output written
+                        so far is left in outputFile.
+    """
+    count = 0
+    batch = []
+    for token in IFToPFConverter(StreamScanner(inputFile, chunkSize)).iter_convert():
+        batch.append(str(token))
+        if len(batch) == batchTokens:
+            outputFile.write((" " if count else "") + " ".join(batch))
+            count += len(batch)
+            batch = []
+    if batch:
+        outputFile.write((" " if count else "") + " ".join(batch))
+        count += len(batch)
+    outputFile.write("\n")
+    return count
+
+
+def interactive():
     """
     Repeatedly prompts the user for an infix expression and prints its postfix equivalent.
     Entering a blank line exits the loop.
@@ -76,13 +274,66 @@ def main():
         sourceStr = input("Enter an infix expression: ").strip()
         if sourceStr == "":
             break
-        scanner = Scanner(sourceStr)
-        converter = IFToPFConverter(scanner)
-        postfix = converter.convert()
+        try:
+            converter = IFToPFConverter(Scanner(sourceStr))
+            postfix = converter.convert()
+        except ValueError as error:
+            print("Error:", error)
+            print()
+            continue
         postfixStr = " ".join(str(token) for token in postfix)
         print("Postfix expression:", postfixStr)
         print()
 
 
+def main(argv=None):
+    """
+    Runs the interactive prompt, or converts a file or stdin in bulk and
+    prints the throughput on stderr.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Convert infix expressions to postfix.")
+    parser.add_argument("input", nargs="?",
+                        help="file of expressions, one per line, or - for stdin")
+    parser.add_argument("-o", "--output", help="file for the postfix lines (default stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes for bulk mode (default: one per CPU)")
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    parser.add_argument("--stream", action="store_true",
+                        help="treat the whole input as one expression and stream it")
+    args = parser.parse_args(argv)
+
+    if args.input is None and sys.stdin.isatty():
+        interactive()
+        return
+
+    if args.input in (None, "-"):
+        inputFile = open(sys.stdin.fileno(), "r", buffering=IO_BUFFER, closefd=False)
+    else:
+        inputFile = open(args.input, "r", buffering=IO_BUFFER)
+    if args.output:
+        outputFile = open(args.output, "w", buffering=IO_BUFFER)
+    else:
+        outputFile = open(sys.stdout.fileno(), "w", buffering=IO_BUFFER, closefd=False)
+
+    with inputFile, outputFile:
+        if args.stream:
+            start = time.perf_counter()
+            try:
+                count = convertStreaming(inputFile, outputFile)
+            except ValueError as error:
+                print("Error:", error, file=sys.stderr)
+                return
+            seconds = time.perf_counter() - start
+            print("tokens: %d\nseconds: %.3f\ntokens/s: %.0f" % (
+                count, seconds, count / (seconds or 1e-9)), file=sys.stderr)
+            return
+        stats = convertStream(inputFile, outputFile, sys.stderr, args.workers,
+                              args.chunk_lines)
+    print(stats, file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,288 @@
+"""
+Name: Neel Srivastava
+Project: Converter scaling benchmark
+Date: 18/10/26
+Summary: Checks that scanning and infix-to-postfix conversion stay O(n).
+Synthetic expressions are generated in three shapes: a flat chain of + and
+-, parentheses nested as deep as the expression is long, and random mixed
+precedence with ^ and short parenthesized groups. For each size the scan
+and the convert are timed separately, and the peak memory of both is
+measured with tracemalloc in its own run, so tracing does not slow the
+timed runs. Results are reported per token. A straight line fitted to
+log(time) against log(tokens) gives the growth exponent for each shape,
+which should stay close to 1.
+
+Results can be saved as a JSON baseline and a later run compared against
+it, flagging any size whose time or memory per token got worse by more than
+the tolerance.
+
+The default sizes go up to 10^6 tokens; 10^7 works too (--sizes ... 10000000)
+but needs a few GB of memory for the token objects.
+
+Usage:
+    python converter_benchmark.py --save baseline.json
+    python converter_benchmark.py --compare baseline.json
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from complexity_fit import fitExponent
+from converter import IFToPFConverter
+from scanner import Scanner
+from sort_benchmark import writeJson
+
+
+SHAPES = ("flat", "nested", "mixed")
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_REPEATS = 3
+# Seconds one scan plus convert may be projected to take
+DEFAULT_BUDGET = 10.0
+# Slowdown (or memory growth) per token that counts as a regression
+DEFAULT_TOLERANCE = 1.25
+# A growth exponent above this is reported as not linear
+LINEAR_LIMIT = 1.15
+
+MIXED_OPERATORS = ("+", "-", "*", "/", "%", "^")
+
+
+def makeExpression(shape, n, seed=0):
+    """
+    Builds an infix expression of about n tokens.
+
+    The pieces are collected in a list and joined once, so building the text
+    is linear as well.
+
+    :param shape: One of SHAPES.
+    :param n: Roughly how many tokens the expression should have.
+    :param seed: Seed for the mixed shape.
+    :return: The expression text.
+    :raises ValueError: If the shape is unknown.
+    """
+    if shape == "flat":
+        # 1 + 2 - 3 + 4 ...
+        pieces = ["1"]
+        for i in range(1, max(1, (n + 1) // 2)):
+            pieces.append("+" if i & 1 else "-")
+            pieces.append(str(i % 10))
+        return " ".join(pieces)
+
+    if shape == "nested":
+        # (((1 + 1) + 1) + 1) with every "(" still open when the next is read
+        depth = max(0, (n - 1) // 4)
+        return "(" * depth + "1" + " + 1)" * depth
+
+    if shape == "mixed":
+        rng = random.Random(seed)
+        pieces = []
+        count = 0
+        while count < n:
+            if pieces:
+                pieces.append(rng.choice(MIXED_OPERATORS))
+                count += 1
+            unit = rng.random()
+            if unit < 0.2:
+                pieces.append("(%d %s %d)" % (rng.randrange(1, 10),
+                                              rng.choice(MIXED_OPERATORS),
+                                              rng.randrange(1, 10)))
+                count += 5
+            else:
+                pieces.append(str(rng.randrange(1, 10)))
+                count += 1
+        return " ".join(pieces)
+
+    raise ValueError("unknown shape: " + str(shape))
+
+
+def timeOnce(source):
+    """
+    Scans and converts source once.
+
+    :return: A (tokens, scan seconds, convert seconds) tuple.
+    """
+    start = time.perf_counter()
+    scanner = Scanner(source)
+    scanned = time.perf_counter()
+    IFToPFConverter(scanner).convert()
+    converted = time.perf_counter()
+    return len(scanner), scanned - start, converted - scanned
+
+
+def peakMemory(source):
+    """Returns the peak bytes allocated while scanning and converting source,
+    not counting the source text itself."""
+    tracemalloc.start()
+    try:
+        IFToPFConverter(Scanner(source)).convert()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(shape, n, repeats=DEFAULT_REPEATS, seed=0):
+    """
+    Times one shape at one size.
+
+    :return: A result row with shape, n, tokens, scan_s, convert_s,
+             total_s, ns_per_token, peak_bytes, bytes_per_token and status.
+    """
+    source = makeExpression(shape, n, seed)
+    scanTimes = []
+    convertTimes = []
+    tokens = 0
+    for _ in range(repeats):
+        tokens, scanTime, convertTime = timeOnce(source)
+        scanTimes.append(scanTime)
+        convertTimes.append(convertTime)
+    peak = peakMemory(source)
+    total = min(scanTimes) + min(convertTimes)
+    return {"shape": shape, "n": n, "tokens": tokens,
+            "scan_s": min(scanTimes), "convert_s": min(convertTimes),
+            "total_s": total, "ns_per_token": 1e9 * total / tokens,
+            "peak_bytes": peak, "bytes_per_token": peak / tokens, "status": "ok"}
+
+
+def runBenchmark(shapes=SHAPES, sizes=DEFAULT_SIZES, repeats=DEFAULT_REPEATS,
+                 budget=DEFAULT_BUDGET, seed=0, verbose=True):
+    """
+    Measures every shape over the sizes, smallest first. Once the next size
+    is projected (linearly) to take longer than the budget, the rest of that
+    shape's sizes are skipped.
+
+    :return: A list of result rows; skipped sizes have status "skipped".
+    """
+    rows = []
+    sizes = sorted(sizes)
+    for shape in shapes:
+        stopped = False
+        for i, n in enumerate(sizes):
+            if stopped:
+                rows.append({"shape": shape, "n": n, "status": "skipped"})
+                continue
+            row = measure(shape, n, repeats, seed)
+            rows.append(row)
+            if verbose:
+                print(formatRow(row), flush=True)
+            if i + 1 < len(sizes) and row["total_s"] * sizes[i + 1] / n > budget:
+                stopped = True
+    return rows
+
+
+def growth(rows):
+    """
+    Fits the time per shape against the token count.
+
+    :return: A dict from shape to the growth exponent, or None if fewer than
+             three sizes were measured.
+    """
+    exponents = {}
+    for shape in dict.fromkeys(row["shape"] for row in rows):
+        points = [(row["tokens"], row["total_s"]) for row in rows
+                  if row["shape"] == shape and row["status"] == "ok" and row["total_s"] > 0]
+        if len(points) >= 3:
+            exponents[shape] = fitExponent([p[0] for p in points], [p[1] for p in points])
+        else:
+            exponents[shape] = None
+    return exponents
+
+
+def compare(rows, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compares result rows with the rows of a saved baseline.
+
+    :param rows: The new result rows.
+    :param baseline: The rows loaded from a baseline file.
+    :param tolerance: Ratio of new to old per-token cost that is a regression.
+    :return: A list of (shape, n, time ratio, memory ratio, regressed) tuples
+             for every size measured in both.
+    """
+    old = {(row["shape"], row["n"]): row for row in baseline if row["status"] == "ok"}
+    results = []
+    for row in rows:
+        before = old.get((row["shape"], row["n"]))
+        if row["status"] != "ok" or before is None:
+            continue
+        timeRatio = row["ns_per_token"] / before["ns_per_token"]
+        memoryRatio = row["bytes_per_token"] / before["bytes_per_token"]
+        results.append((row["shape"], row["n"], timeRatio, memoryRatio,
+                        timeRatio > tolerance or memoryRatio > tolerance))
+    return results
+
+
+HEADER = "%-7s %9s %10s %10s %10s %9s %9s" % (
+    "shape", "tokens", "scan (s)", "conv (s)", "total (s)", "ns/token", "B/token")
+
+
+def formatRow(row):
+    """Returns one result row as a line of the results table."""
+    if row["status"] != "ok":
+        return "%-7s %9d  %s" % (row["shape"], row["n"], row["status"])
+    return "%-7s %9d %10.4f %10.4f %10.4f %9.0f %9.1f" % (
+        row["shape"], row["tokens"], row["scan_s"], row["convert_s"], row["total_s"],
+        row["ns_per_token"], row["bytes_per_token"])
+
+
+def formatGrowth(exponents):
+    """Returns the growth exponents, flagging any that are not linear."""
+    lines = []
+    for shape, exponent in exponents.items():
+        if exponent is None:
+            lines.append("%-7s growth: too few sizes" % shape)
+        else:
+            flag = "  NOT LINEAR" if exponent > LINEAR_LIMIT else ""
+            lines.append("%-7s growth: n^%.2f%s" % (shape, exponent, flag))
+    return "\n".join(lines)
+
+
+def formatComparison(results):
+    """Returns the baseline comparison as a table."""
+    lines = ["%-7s %9s %10s %10s" % ("shape", "n", "time x", "memory x")]
+    for shape, n, timeRatio, memoryRatio, regressed in results:
+        lines.append("%-7s %9d %10.2f %10.2f%s" % (
+            shape, n, timeRatio, memoryRatio, "  REGRESSION" if regressed else ""))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Parses the command line, runs the benchmark, prints the results and
+    growth exponents, and saves or compares a baseline.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark scanning and conversion by size.")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="skip sizes projected to take longer than this (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="per-token slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+    print("-" * len(HEADER))
+    rows = runBenchmark(args.shapes, args.sizes, args.repeats, args.budget, args.seed)
+    print()
+    print(formatGrowth(growth(rows)))
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        print()
+        print(formatComparison(compare(rows, baseline, args.tolerance)))
+    if args.save:
+        writeJson(rows, args.save, {"shapes": args.shapes, "sizes": args.sizes,
+                                    "repeats": args.repeats, "seed": args.seed})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+Name: Neel Srivastava
+Project: Compiled postfix evaluator
+Date: 18/10/26
+Summary: Evaluates the postfix lists made by converter.py. A postfix list
+is compiled once into a Program: an array of opcodes, a matching list of
+operands (the number to push, or the function for an operator), and the
+deepest the value stack will get. Evaluating walks the two arrays over a
+stack of exactly that size, so nothing is appended or popped, and
+malformed expressions are caught while compiling instead of halfway through.
+
+An Evaluator keeps compiled programs in an LRU cache keyed by the source
+string, so an expression seen before skips scanning, conversion and
+compiling. A program made only of numbers always has the same value, so
+that value is also saved on the program and a cache hit just returns it.
+
+Expressions may use variables. Program.evaluate takes a dict of values,
+and Program.evaluateColumns runs the program once over whole columns of
+values (lists, array.array, or NumPy arrays): each operator is applied to
+entire columns at a time, with NumPy when it is installed and otherwise as
+one map() per operator, instead of running the program once per row.
+
+A code object (compile() of the rebuilt infix text) was not used: deeply
+nested expressions overflow the Python parser, while the opcode array has
+no depth limit.
+
+Division is integer division, like the rest of the integer-only scanner;
+dividing by zero raises ZeroDivisionError.
+"""
+
+import operator
+from array import array
+from functools import lru_cache
+from itertools import repeat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from converter import IFToPFConverter
+from scanner import Scanner
+from tokens import Token
+
+
+# Opcodes for pushing a number and loading a variable; operator opcodes
+# are their Token kinds
+PUSH = 0
+LOAD = 1
+
+# Token kind -> function applied to (left, right)
+OPERATIONS = {
+    Token.PLUS: operator.add,
+    Token.MINUS: operator.sub,
+    Token.MUL: operator.mul,
+    Token.DIV: operator.floordiv,
+    Token.MOD: operator.mod,
+    Token.EXP: operator.pow,
+}
+
+DEFAULT_CACHE_SIZE = 4096
+
+HAVE_NUMPY = numpy is not None
+
+# Range of a NumPy int64, the type integer columns are computed in
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def _columnBounds(column):
+    """Returns the (lowest, highest) Python int in an integer ndarray, or
+    None if the column holds floats (or anything else)."""
+    if column.dtype.kind not in "biu":
+        return None
+    if not len(column):
+        return 0, 0
+    return int(column.min()), int(column.max())
+
+
+def _operatorBounds(kind, left, right):
+    """
+    Bounds the result of one integer operator from the bounds of its sides.
+
+    :param kind: The operator's Token kind.
+    :param left: (lowest, highest) of the left side.
+    :param right: (lowest, highest) of the right side.
+    :return: (lowest, highest) of the result, or None if the result may not
+             be an int64 (it may overflow, or ^ may get a negative exponent
+             and give a float).
+    """
+    leftLow, leftHigh = left
+    rightLow, rightHigh = right
+    if kind == Token.PLUS:
+        return leftLow + rightLow, leftHigh + rightHigh
+    if kind == Token.MINUS:
+        return leftLow - rightHigh, leftHigh - rightLow
+    if kind == Token.MUL:
+        products = (leftLow * rightLow, leftLow * rightHigh,
+                    leftHigh * rightLow, leftHigh * rightHigh)
+        return min(products), max(products)
+    if kind == Token.DIV:
+        # |a // b| <= |a| for a nonzero integer b
+        largest = max(-leftLow, leftHigh)
+        return -largest, largest
+    if kind == Token.MOD:
+        largest = max(-rightLow, rightHigh)
+        return -largest, largest
+    # Token.EXP
+    if rightLow < 0:
+        return None
+    largest = max(-leftLow, leftHigh)
+    if largest <= 1:
+        return -1, 1
+    # Give up before building a huge int: largest ** rightHigh is at least
+    # 2 ** (rightHigh * (bit_length - 1))
+    if rightHigh * (largest.bit_length() - 1) >= 63:
+        return None
+    largest = largest ** rightHigh
+    return -largest, largest
+
+
+def _plainList(column):
+    """Returns a column as a list of plain Python numbers. ndarray and
+    array.array columns go through tolist(), since iterating an ndarray
+    gives NumPy scalars, which overflow and do not raise on division by
+    zero."""
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
+
+
+def _applyColumns(function, left, right):
+    """Applies an operator where either side may be a column (a list) or a
+    single number, as one map() over the columns."""
+    if isinstance(left, list):
+        if isinstance(right, list):
+            return list(map(function, left, right))
+        return list(map(function, left, repeat(right)))
+    if isinstance(right, list):
+        return list(map(function, repeat(left), right))
+    return function(left, right)
+
+
+class Program(object):
+    """A compiled postfix expression."""
+
+    __slots__ = ("source", "code", "operands", "depth", "names", "constant",
+                 "_value")
+
+    def __init__(self, code, operands, depth, names=(), source=None):
+        """Stores the compiled arrays. Use compilePostfix to make one.
+        names are the variables the program reads."""
+        self.source = source
+        self.code = code
+        self.operands = operands
+        self.depth = depth
+        self.names = names
+        self.constant = not names
+        self._value = None
+
+    def __len__(self):
+        """Returns the number of instructions."""
+        return len(self.code)
+
+    def run(self, variables=None):
+        """Evaluates the program on a value stack of its own and returns
+        the result. Raises KeyError if a variable is missing from variables."""
+        # A new stack per run, since cached programs are shared between
+        # threads; at these depths it costs about as much as reusing one
+        stack = [None] * self.depth
+        top = 0
+        for opcode, operand in zip(self.code, self.operands):
+            if opcode == PUSH:
+                stack[top] = operand
+                top += 1
+            elif opcode == LOAD:
+                stack[top] = variables[operand]
+                top += 1
+            else:
+                top -= 1
+                stack[top - 1] = operand(stack[top - 1], stack[top])
+        return stack[0]
+
+    def evaluate(self, variables=None):
+        """Returns the value of the program for a dict of variable values,
+        saving it if the program is constant so later calls skip the run."""
+        if not self.constant:
+            return self.run(variables)
+        if self._value is None:
+            self._value = self.run()
+        return self._value
+
+    def evaluateColumns(self, columns, useNumpy=True):
+        """
+        Evaluates the program once over whole columns of variable values.
+
+        Every operator is one whole-column operation: a NumPy operation when
+        NumPy is installed (array.array and list columns are converted with
+        numpy.asarray), otherwise one map() over plain lists.
+
+        Integer columns are computed in int64 only when the program cannot
+        leave that range: the lowest and highest value of every column are
+        carried through the operators, and if any step might overflow, or
+        ^ might get a negative exponent, the plain list path runs instead.
+        Results then match evaluate row for row (exact big ints, and a
+        float for a negative power), and come back as a list.
+
+        Float columns always use NumPy when it is there, and follow NumPy's
+        float rules rather than Python's: a power too large for a float
+        gives inf instead of raising OverflowError, and a negative number
+        to a fractional power gives nan instead of a complex number.
+
+        :param columns: A dict from variable name to a column of values,
+                        all the same length.
+        :param useNumpy: False to always use the plain list path.
+        :return: A NumPy array or a list with one result per row, or the
+                 single value if the program has no variables.
+        :raises KeyError: If a variable has no column.
+        :raises ValueError: If the columns differ in length.
+        :raises ZeroDivisionError: If a row divides by zero.
+        """
+        if self.constant:
+            return self.evaluate()
+        lengths = {len(columns[name]) for name in self.names}
+        if len(lengths) > 1:
+            raise ValueError("columns must all be the same length")
+
+        if useNumpy and numpy is not None:
+            arrays = {name: numpy.asarray(columns[name]) for name in self.names}
+            if self._fitsInt64(arrays):
+                values = {name: column.astype(numpy.int64)
+                          if column.dtype.kind in "biu" else column
+                          for name, column in arrays.items()}
+                try:
+                    # Make integer division by zero raise, like the scalar path
+                    with numpy.errstate(divide="raise"):
+                        return self._runColumns(values, None)
+                except FloatingPointError as error:
+                    raise ZeroDivisionError(str(error))
+            # tolist() gives Python ints, which cannot overflow
+            values = {name: column.tolist() for name, column in arrays.items()}
+        else:
+            values = {name: _plainList(columns[name]) for name in self.names}
+        return self._runColumns(values, _applyColumns)
+
+    def _fitsInt64(self, arrays):
+        """Returns True if every integer step of the program stays inside
+        int64 for the given ndarray columns. Steps with a float column on
+        either side are not checked, since they are computed in floats."""
+        stack = [None] * self.depth
+        top = 0
+        for opcode, operand in zip(self.code, self.operands):
+            if opcode == PUSH:
+                stack[top] = (operand, operand)
+                top += 1
+            elif opcode == LOAD:
+                stack[top] = _columnBounds(arrays[operand])
+                top += 1
+            else:
+                top -= 1
+                left, right = stack[top - 1], stack[top]
+                if left is None or right is None:
+                    stack[top - 1] = None
+                    continue
+                bounds = _operatorBounds(opcode, left, right)
+                if bounds is None:
+                    return False
+                stack[top - 1] = bounds
+            bounds = stack[top - 1]
+            if bounds is not None and (bounds[0] < INT64_MIN or bounds[1] > INT64_MAX):
+                return False
+        return True
+
+    def _runColumns(self, values, apply):
+        """Runs the program with each variable bound to a whole column.
+        apply(function, left, right) does one operator, or None to call the
+        operator function directly (NumPy broadcasts numbers itself)."""
+        stack = [None] * self.depth
+        top = 0
+        for opcode, operand in zip(self.code, self.operands):
+            if opcode == PUSH:
+                stack[top] = operand
+                top += 1
+            elif opcode == LOAD:
+                stack[top] = values[operand]
+                top += 1
+            else:
+                top -= 1
+                if apply is None:
+                    stack[top - 1] = operand(stack[top - 1], stack[top])
+                else:
+                    stack[top - 1] = apply(operand, stack[top - 1], stack[top])
+        return stack[0]
+
+
+def compilePostfix(postfix, source=None):
+    """
+    Compiles a postfix list of Tokens into a Program.
+
+    :param postfix: The tokens, as returned by IFToPFConverter.convert.
+    :param source: The infix text, kept on the program for reference.
+    :return: A Program.
+    :raises ValueError: If the postfix list is empty, an operator is missing
+                        an operand, or operands are left over.
+    """
+    code = array("B")
+    operands = []
+    names = {}
+    depth = 0
+    deepest = 0
+    for token in postfix:
+        kind = token.kind
+        if kind == Token.INT or kind == Token.VAR:
+            if kind == Token.INT:
+                code.append(PUSH)
+            else:
+                code.append(LOAD)
+                names[token.value] = None
+            operands.append(token.value)
+            depth += 1
+            if depth > deepest:
+                deepest = depth
+        elif kind in OPERATIONS:
+            if depth < 2:
+                raise ValueError("operator %s is missing an operand" % token)
+            code.append(kind)
+            operands.append(OPERATIONS[kind])
+            depth -= 1
+        else:
+            raise ValueError("cannot evaluate token %s" % token)
+    if depth != 1:
+        raise ValueError("empty expression" if depth == 0 else "missing operator")
+    return Program(code, operands, deepest, tuple(names), source)
+
+
+def compileSource(source):
+    """
+    Scans, converts and compiles an infix expression.
+
+    :param source: The infix text.
+    :return: A Program.
+    :raises ValueError: If the text cannot be scanned, converted or compiled.
+    """
+    return compilePostfix(IFToPFConverter(Scanner(source)).convert(), source)
+
+
+class Evaluator(object):
+    """Evaluates infix expressions, caching the compiled programs."""
+
+    def __init__(self, cacheSize=DEFAULT_CACHE_SIZE):
+        """Sets up an empty cache holding at most cacheSize programs."""
+        self.cacheSize = cacheSize
+        self._compile = lru_cache(maxsize=cacheSize)(compileSource)
+
+    def compile(self, source):
+        """Returns the Program for source, from the cache if it is there."""
+        return self._compile(source)
+
+    def evaluate(self, source, variables=None):
+        """Returns the value of the infix expression source for a dict of
+        variable values. Raises ValueError if it is malformed."""
+        return self._compile(source).evaluate(variables)
+
+    def evaluateColumns(self, source, columns, useNumpy=True):
+        """Evaluates source once over whole columns of variable values;
+        see Program.evaluateColumns."""
+        return self._compile(source).evaluateColumns(columns, useNumpy)
+
+    def cacheInfo(self):
+        """Returns the hits, misses, maxsize and currsize of the cache."""
+        return self._compile.cache_info()
+
+    def clear(self):
+        """Empties the cache."""
+        self._compile.cache_clear()
+
+
+def main():
+    """
+    Repeatedly prompts the user for an infix expression, then for the value of
+    each variable in it, and prints its postfix form and value. Entering a
+    blank line exits the loop.
+
+    :param: None
+    :return: None
+    """
+    print("Infix Expression Evaluator")
+    print("Enter a blank line to quit.\n")
+    evaluator = Evaluator()
+    while True:
+        sourceStr = input("Enter an infix expression: ").strip()
+        if sourceStr == "":
+            break
+        try:
+            program = evaluator.compile(sourceStr)
+            variables = {name: int(input("  %s = " % name)) for name in program.names}
+            value = program.evaluate(variables)
+        except (ValueError, ZeroDivisionError) as error:
+            print("Error:", error)
+            print()
+            continue
+        postfix = IFToPFConverter(Scanner(sourceStr)).convert()
+        print("Postfix expression:", " ".join(str(token) for token in postfix))
+        print("Value:", value)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Name: Neel Srivastava
+Project: Exponent benchmark
+Date: 18/10/26
+Summary: Times the exponent functions in Calculate_Exponent.py against each
+other and against the built-in pow over exponents from 10 up to 10^6.
+expo_r shows up as a RecursionError around 1000. The modular functions are
+timed separately with a large prime modulus.
+
+The batch section times expo_batch on whole lists of (base, exponent)
+pairs against calling the loop functions once per pair: expo, expo_r and
+expo_sq on float bases, and expo_r (reduced afterwards), expo_mod and pow
+on integer bases under a small modulus. With NumPy installed expo_batch uses
+it for both; otherwise it groups the pairs by exponent in pure Python.
+
+The fixed-base section raises a handful of bases to many random exponents
+under the modulus, comparing expo_mod and pow with FixedBaseExponentiator,
+and prints the exponentiator's cache and multiplication report.
+
+The O(n) versions do O(n) big-int multiplications on numbers that keep
+growing, so their time grows about as n^2. A case stops as soon as the
+next exponent is projected (at that n^2 rate) to take longer than the time
+budget, instead of waiting a hundred times longer to find out.
+
+Usage:
+    python exponent_benchmark.py --max-exponent 1000000 --budget 1
+    python exponent_benchmark.py --batch-sizes 100000 1000000 10000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import Calculate_Exponent
+from Calculate_Exponent import (FixedBaseExponentiator, expo, expo_batch, expo_generic,
+                                expo_mod, expo_r, expo_sq, expo_sq_r)
+
+
+# Name -> function taking (base, exponent)
+PLAIN_CASES = {
+    "expo": expo,
+    "expo_r": expo_r,
+    "expo_sq": expo_sq,
+    "expo_sq_r": expo_sq_r,
+    "expo_generic": lambda base, exponent: expo_generic(base, exponent, int.__mul__, 1),
+    "pow": pow,
+}
+
+# Name -> function taking (base, exponent, mod)
+MODULAR_CASES = {
+    "expo_mod": expo_mod,
+    "pow(b, e, m)": pow,
+}
+
+DEFAULT_BASE = 3
+DEFAULT_MOD = 2 ** 127 - 1
+DEFAULT_MAX_EXPONENT = 10 ** 6
+DEFAULT_REPEATS = 3
+DEFAULT_BUDGET = 1.0
+
+# Pairs per batch; 10^7 is left for --batch-sizes since it needs a few GB
+DEFAULT_BATCH_SIZES = (10 ** 5, 10 ** 6)
+# Batch exponents are drawn from 0..BATCH_MAX_EXPONENT
+BATCH_MAX_EXPONENT = 64
+BATCH_MOD = 1000003
+
+DEFAULT_FIXED_BASE_CALLS = 20000
+FIXED_BASES = (2, 3, 5, 7, 11, 13, 17, 19)
+FIXED_EXPONENT_BITS = 256
+
+
+def exponentSweep(maxExponent=DEFAULT_MAX_EXPONENT):
+    """Returns the powers of ten from 10 up to maxExponent."""
+    exponents = []
+    exponent = 10
+    while exponent <= maxExponent:
+        exponents.append(exponent)
+        exponent *= 10
+    return exponents
+
+
+def timeCall(function, args, repeats):
+    """
+    Calls function(*args) repeats times.
+
+    :return: A (min, median) tuple of the durations in seconds.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def runCases(cases, exponents, makeArgs, repeats=DEFAULT_REPEATS, budget=DEFAULT_BUDGET):
+    """
+    Times every case over the exponents, skipping the rest of a case's
+    exponents once it raises or its next call is projected to go over the
+    budget.
+
+    :param cases: A dict from name to function.
+    :param exponents: The exponents to try, smallest first.
+    :param makeArgs: A function from exponent to the argument tuple.
+    :param repeats: How many timed calls per exponent.
+    :param budget: Seconds one call may be projected to take.
+    :return: A list of (name, exponent, min, median, status) rows.
+    """
+    rows = []
+    for name, function in cases.items():
+        stopped = None
+        for i, exponent in enumerate(exponents):
+            if stopped:
+                rows.append((name, exponent, None, None, stopped))
+                continue
+            try:
+                best, median = timeCall(function, makeArgs(exponent), repeats)
+            except RecursionError:
+                rows.append((name, exponent, None, None, "RecursionError"))
+                stopped = "skipped"
+                continue
+            rows.append((name, exponent, best, median, "ok"))
+            if i + 1 < len(exponents) and \
+               best * (exponents[i + 1] / exponent) ** 2 > budget:
+                stopped = "over budget"
+    return rows
+
+
+def makeBatch(n, kind, seed=0):
+    """
+    Builds n random (base, exponent) pairs for the batch timings.
+
+    :param n: Number of pairs.
+    :param kind: "float" for bases in [0.5, 1.5), or "int" for integer
+                 bases below BATCH_MOD.
+    :param seed: Seed for the random generator.
+    :return: A (bases, exponents) tuple of lists.
+    """
+    rng = random.Random(seed)
+    if kind == "float":
+        bases = [0.5 + rng.random() for _ in range(n)]
+    else:
+        bases = [rng.randrange(BATCH_MOD) for _ in range(n)]
+    exponents = [rng.randint(0, BATCH_MAX_EXPONENT) for _ in range(n)]
+    return bases, exponents
+
+
+def batchCases(kind):
+    """
+    Returns the cases for one kind of batch, as a dict from name to a
+    function taking (bases, exponents).
+    """
+    mod = BATCH_MOD if kind == "int" else None
+    if mod is None:
+        cases = {
+            "loop expo": lambda bases, exponents: list(map(expo, bases, exponents)),
+            "loop expo_r": lambda bases, exponents: list(map(expo_r, bases, exponents)),
+            "loop expo_sq": lambda bases, exponents: list(map(expo_sq, bases, exponents)),
+        }
+    else:
+        # Batch exponents stay small, so expo_r is well inside the recursion
+        # limit and its exact powers stay a few hundred digits long
+        cases = {
+            "loop expo_r": lambda bases, exponents: [
+                expo_r(b, e) % mod for b, e in zip(bases, exponents)],
+            "loop expo_mod": lambda bases, exponents: [
+                expo_mod(b, e, mod) for b, e in zip(bases, exponents)],
+            "loop pow": lambda bases, exponents: [
+                pow(b, e, mod) for b, e in zip(bases, exponents)],
+        }
+    cases["expo_batch python"] = lambda bases, exponents: expo_batch(
+        bases, exponents, mod, use_numpy=False)
+    if Calculate_Exponent.numpy is not None:
+        cases["expo_batch numpy"] = lambda bases, exponents: expo_batch(bases, exponents, mod)
+    return cases
+
+
+def runBatch(sizes=DEFAULT_BATCH_SIZES, repeats=DEFAULT_REPEATS, seed=0):
+    """
+    Times every batch case for float and integer bases at each size.
+
+    :param sizes: Numbers of pairs per batch.
+    :param repeats: How many timed calls per size.
+    :param seed: Seed for the pairs.
+    :return: A dict from kind to a list of (name, pairs, min, median) rows.
+    """
+    results = {}
+    for kind in ("float", "int"):
+        rows = []
+        for n in sizes:
+            bases, exponents = makeBatch(n, kind, seed)
+            for name, function in batchCases(kind).items():
+                best, median = timeCall(function, (bases, exponents), repeats)
+                rows.append((name, n, best, median))
+        results[kind] = rows
+    return results
+
+
+def formatBatch(title, rows):
+    """Returns batch rows as a table with pairs per second."""
+    header = "%-18s %9s %12s %12s %14s" % ("function", "pairs", "min (s)", "median (s)", "pairs/s")
+    lines = [title, header, "-" * len(header)]
+    for name, n, best, median in rows:
+        lines.append("%-18s %9d %12.6f %12.6f %14.0f" % (
+            name, n, best, median, n / best if best else float("inf")))
+    return "\n".join(lines)
+
+
+def runFixedBase(calls=DEFAULT_FIXED_BASE_CALLS, mod=DEFAULT_MOD,
+                 window=FixedBaseExponentiator.DEFAULT_WINDOW, seed=0):
+    """
+    Times calls random (base, exponent) pairs from FIXED_BASES, once with
+    each of expo_mod, pow and a fresh FixedBaseExponentiator.
+
+    :return: A (rows, exponentiator) tuple, where rows holds
+             (name, calls, seconds) and exponentiator has the counters.
+    """
+    rng = random.Random(seed)
+    pairs = [(rng.choice(FIXED_BASES), rng.getrandbits(FIXED_EXPONENT_BITS))
+             for _ in range(calls)]
+    exponentiator = FixedBaseExponentiator(window, mod=mod)
+    cases = {
+        "expo_mod": lambda b, e: expo_mod(b, e, mod),
+        "pow(b, e, m)": lambda b, e: pow(b, e, mod),
+        "fixed-base w=%d" % window: exponentiator.power,
+    }
+    rows = []
+    for name, function in cases.items():
+        start = time.perf_counter()
+        for base, exponent in pairs:
+            function(base, exponent)
+        rows.append((name, calls, time.perf_counter() - start))
+    return rows, exponentiator
+
+
+def formatRows(title, rows):
+    """Returns benchmark rows as a table with a title and header line."""
+    header = "%-14s %9s %12s %12s  %s" % ("function", "exponent", "min (s)", "median (s)", "status")
+    lines = [title, header, "-" * len(header)]
+    for name, exponent, best, median, status in rows:
+        lines.append("%-14s %9d %12s %12s  %s" % (
+            name, exponent,
+            "-" if best is None else "%.6f" % best,
+            "-" if median is None else "%.6f" % median,
+            status))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Parses the command line and prints the plain, modular, batch and
+    fixed-base timings.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Calculate_Exponent functions.")
+    parser.add_argument("--base", type=int, default=DEFAULT_BASE)
+    parser.add_argument("--mod", type=int, default=DEFAULT_MOD)
+    parser.add_argument("--max-exponent", type=int, default=DEFAULT_MAX_EXPONENT)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="skip exponents projected to take longer than this per call (s)")
+    parser.add_argument("--batch-sizes", nargs="*", type=int, default=list(DEFAULT_BATCH_SIZES),
+                        help="pairs per expo_batch run, none to skip the batch timings")
+    parser.add_argument("--fixed-base-calls", type=int, default=DEFAULT_FIXED_BASE_CALLS,
+                        help="calls in the fixed-base timings, 0 to skip them")
+    parser.add_argument("--window", type=int, default=FixedBaseExponentiator.DEFAULT_WINDOW,
+                        help="window bits for the fixed-base tables")
+    args = parser.parse_args(argv)
+
+    exponents = exponentSweep(args.max_exponent)
+    print(formatRows("Integer base %d" % args.base,
+                     runCases(PLAIN_CASES, exponents, lambda e: (args.base, e),
+                              args.repeats, args.budget)))
+    print()
+    print(formatRows("Modulo %d" % args.mod,
+                     runCases(MODULAR_CASES, exponents, lambda e: (args.base, e, args.mod),
+                              args.repeats, args.budget)))
+
+    if args.batch_sizes:
+        batch = runBatch(args.batch_sizes, args.repeats)
+        print()
+        print(formatBatch("Batch, float bases, exponents 0..%d" % BATCH_MAX_EXPONENT,
+                          batch["float"]))
+        print()
+        print(formatBatch("Batch, integer bases modulo %d" % BATCH_MOD, batch["int"]))
+
+    if args.fixed_base_calls > 0:
+        rows, exponentiator = runFixedBase(args.fixed_base_calls, args.mod, args.window)
+        print()
+        print("Fixed base, %d bases, %d-bit exponents modulo %d" % (
+            len(FIXED_BASES), FIXED_EXPONENT_BITS, args.mod))
+        for name, calls, seconds in rows:
+            print("%-18s %9d calls %10.4f s" % (name, calls, seconds))
+        print(exponentiator.report())
+
+
+if __name__ == "__main__":
+    main()
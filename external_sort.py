@@ -0,0 +1,318 @@
+"""
+Name: Neel Srivastava
+Project: External merge sort
+Date: 18/10/26
+Summary: Sorts a file of integers that is too big to fit in memory. The
+input is streamed in blocks, cut into runs that fit in the memory budget,
+and each run is sorted in memory and spilled to a temporary file as raw
+64-bit integers. The runs are then merged with heapq.merge, at most fan_in
+runs at a time, through buffered readers and writers, so only a block of
+each run is in memory at once. If there are more runs than fan_in, extra
+merge passes are made. The bytes read and written and the number of passes
+are reported so the memory budget can be tuned for multi-GB inputs.
+
+Input and output can each be text (integers separated by whitespace) or
+binary (native-endian signed 64-bit integers).
+
+Usage:
+    python external_sort.py numbers.txt sorted.txt --memory 256M
+"""
+
+import argparse
+import heapq
+import os
+import shutil
+import tempfile
+import time
+from array import array
+from itertools import islice
+
+
+# Rough memory cost of one int held in a Python list (the int object plus
+# the list slot), used to turn the memory budget into a run length
+BYTES_PER_ITEM = 36
+DEFAULT_MEMORY = 64 * 1024 * 1024
+# Most runs merged in one pass
+DEFAULT_FAN_IN = 64
+# Bytes read from a text file per block
+TEXT_BLOCK = 1024 * 1024
+# Smallest number of items buffered per reader or writer
+MIN_BUFFER_ITEMS = 1024
+
+FORMATS = ("text", "binary")
+SIZE_SUFFIXES = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+class SortStats(object):
+    """Counters collected while a file is sorted."""
+
+    def __init__(self):
+        self.items = 0
+        self.runs = 0
+        self.passes = 0
+        self.bytesRead = 0
+        self.bytesWritten = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        """Returns the counters as a short report."""
+        return ("items: %d\nruns: %d\npasses: %d\nbytes read: %d\n"
+                "bytes written: %d\nseconds: %.3f" % (
+                    self.items, self.runs, self.passes, self.bytesRead,
+                    self.bytesWritten, self.seconds))
+
+
+def parseSize(text):
+    """
+    Turns a size such as "512K", "64M" or "2G" into a number of bytes.
+
+    :param text: A number with an optional K, M or G suffix.
+    :return: The size in bytes.
+    :raises ValueError: If text is not a valid size.
+    """
+    text = text.strip().upper()
+    if text and text[-1] in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def readText(path, stats):
+    """
+    Streams the integers in a text file, separated by any whitespace.
+
+    The file is read in fixed-size blocks, so very long lines are fine. A
+    number cut in two by a block boundary is carried over to the next block.
+
+    :param path: The text file to read.
+    :param stats: The SortStats to add the bytes read to.
+    :return: A generator of lists of integers.
+    """
+    pending = b""
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(TEXT_BLOCK)
+            if not block:
+                break
+            stats.bytesRead += len(block)
+            block = pending + block
+            tokens = block.split()
+            pending = b""
+            if tokens and not block[-1:].isspace():
+                pending = tokens.pop()
+            yield [int(token) for token in tokens]
+    if pending:
+        yield [int(pending)]
+
+
+def readBinary(path, stats, bufferItems=MIN_BUFFER_ITEMS):
+    """
+    Streams the 64-bit integers in a binary file.
+
+    :param path: The binary file to read.
+    :param stats: The SortStats to add the bytes read to.
+    :param bufferItems: How many integers to read per block.
+    :return: A generator of array('q') blocks.
+    """
+    with open(path, "rb") as file:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(file, bufferItems)
+            except EOFError:
+                # fromfile still keeps the items it did read
+                pass
+            if not block:
+                break
+            stats.bytesRead += len(block) * block.itemsize
+            yield block
+
+
+def _items(blocks):
+    """Flattens a generator of blocks into a generator of items."""
+    for block in blocks:
+        yield from block
+
+
+def writeItems(items, file, fileFormat, stats, bufferItems):
+    """
+    Writes integers to an open binary-mode file, one block at a time.
+
+    :param items: An iterator of integers, usually a heapq.merge.
+    :param file: The file to write to.
+    :param fileFormat: "text" for one integer per line, or "binary".
+    :param stats: The SortStats to add the bytes written to.
+    :param bufferItems: How many integers to buffer per write.
+    :return: None
+    """
+    items = iter(items)
+    while True:
+        block = array("q", islice(items, bufferItems))
+        if not block:
+            break
+        if fileFormat == "binary":
+            data = block.tobytes()
+        else:
+            data = ("\n".join(map(str, block)) + "\n").encode()
+        file.write(data)
+        stats.bytesWritten += len(data)
+
+
+def _spill(run, directory, stats):
+    """Writes one sorted run to a new temporary file and returns its path."""
+    handle, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(handle, "wb") as file:
+        data = array("q", run)
+        data.tofile(file)
+        stats.bytesWritten += len(data) * data.itemsize
+    stats.runs += 1
+    return path
+
+
+def makeRuns(blocks, runLength, sorter, directory, stats):
+    """
+    Cuts the input into runs of runLength items, sorts each run in memory,
+    and spills it to a temporary file.
+
+    :param blocks: A generator of blocks of integers.
+    :param runLength: Most items held in memory at once.
+    :param sorter: A function that sorts a list in place.
+    :param directory: Where to put the run files.
+    :param stats: The SortStats to update.
+    :return: A list of run file paths, or (None, run) if the whole input
+             fit in one run, so it can be written out without spilling.
+    """
+    paths = []
+    run = []
+    for block in blocks:
+        run.extend(block)
+        while len(run) >= runLength:
+            rest = run[runLength:]
+            del run[runLength:]
+            stats.items += len(run)
+            sorter(run)
+            paths.append(_spill(run, directory, stats))
+            run = rest
+
+    stats.items += len(run)
+    sorter(run)
+    if not paths:
+        return None, run
+    if run:
+        paths.append(_spill(run, directory, stats))
+    return paths, None
+
+
+def mergeRuns(paths, outputFile, fileFormat, stats, bufferItems):
+    """
+    Merges sorted run files into an open output file with heapq.merge.
+
+    :param paths: The run files to merge.
+    :param outputFile: An open binary-mode file for the merged output.
+    :param fileFormat: "text" or "binary" for the output.
+    :param stats: The SortStats to update.
+    :param bufferItems: Items buffered per reader and for the writer.
+    :return: None
+    """
+    readers = [_items(readBinary(path, stats, bufferItems)) for path in paths]
+    writeItems(heapq.merge(*readers), outputFile, fileFormat, stats, bufferItems)
+
+
+def externalSort(inputPath, outputPath, memory=DEFAULT_MEMORY,
+                 inputFormat="text", outputFormat="text",
+                 fanIn=DEFAULT_FAN_IN, sorter=list.sort, tempDir=None):
+    """
+    Sorts the integers in inputPath into outputPath within a memory budget.
+
+    :param inputPath: The file to sort.
+    :param outputPath: The file to write the sorted integers to.
+    :param memory: Rough memory budget in bytes.
+    :param inputFormat: "text" or "binary".
+    :param outputFormat: "text" or "binary".
+    :param fanIn: Most runs merged at once, at least 2.
+    :param sorter: A function that sorts a list in place, list.sort by default.
+    :param tempDir: Directory for the run files, or None for the system default.
+    :return: A SortStats with the bytes read and written and the passes made.
+    :raises ValueError: If a format is unknown or fanIn is below 2.
+    """
+    if inputFormat not in FORMATS or outputFormat not in FORMATS:
+        raise ValueError("format must be one of " + ", ".join(FORMATS))
+    if fanIn < 2:
+        raise ValueError("fanIn must be at least 2")
+
+    stats = SortStats()
+    start = time.perf_counter()
+    runLength = max(MIN_BUFFER_ITEMS, memory // BYTES_PER_ITEM)
+    # While merging, each reader and the writer hold one array('q') block
+    bufferItems = max(MIN_BUFFER_ITEMS, memory // (8 * (fanIn + 1)))
+
+    if inputFormat == "binary":
+        blocks = readBinary(inputPath, stats, bufferItems)
+    else:
+        blocks = readText(inputPath, stats)
+
+    directory = tempfile.mkdtemp(prefix="external_sort_", dir=tempDir)
+    try:
+        paths, run = makeRuns(blocks, runLength, sorter, directory, stats)
+        stats.passes = 1
+
+        with open(outputPath, "wb") as output:
+            if paths is None:
+                writeItems(run, output, outputFormat, stats, bufferItems)
+                return stats
+
+            # Merge groups of fanIn runs until one last merge is enough
+            while len(paths) > fanIn:
+                merged = []
+                for i in range(0, len(paths), fanIn):
+                    group = paths[i:i + fanIn]
+                    handle, path = tempfile.mkstemp(suffix=".run", dir=directory)
+                    with os.fdopen(handle, "wb") as file:
+                        mergeRuns(group, file, "binary", stats, bufferItems)
+                    for old in group:
+                        os.remove(old)
+                    merged.append(path)
+                paths = merged
+                stats.passes += 1
+
+            mergeRuns(paths, output, outputFormat, stats, bufferItems)
+            stats.passes += 1
+        return stats
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        stats.seconds = time.perf_counter() - start
+
+
+def main(argv=None):
+    """
+    Parses the command line, sorts the file, and prints the stats.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Sort a file of integers larger than memory.")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--memory", type=parseSize, default=DEFAULT_MEMORY,
+                        help="memory budget, e.g. 512K, 64M, 2G (default 64M)")
+    parser.add_argument("--input-format", choices=FORMATS, default="text")
+    parser.add_argument("--output-format", choices=FORMATS, default="text")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN,
+                        help="most runs merged at once")
+    parser.add_argument("--algorithm", default="builtin",
+                        help="list sort from 3.4.py for each run, e.g. radixSort "
+                             "(default: list.sort)")
+    parser.add_argument("--tmp", help="directory for the temporary run files")
+    args = parser.parse_args(argv)
+
+    sorter = list.sort
+    if args.algorithm != "builtin":
+        import sorts
+        sorter = getattr(sorts, args.algorithm)
+
+    stats = externalSort(args.input, args.output, args.memory, args.input_format,
+                         args.output_format, args.fan_in, sorter, args.tmp)
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Name: Neel Srivastava
+Project: Palindrome analysis with Manacher's algorithm
+Date: 18/10/26
+Summary: Finds every maximal palindrome in a text in linear time. The text
+is cleaned the same way palindrome.isPalindrome does it (only letters and
+digits, lowercased), and Manacher's algorithm fills two array('i') buffers:
+the radius of the longest odd palindrome centred on each character, and of
+the longest even palindrome centred just before it. From those come the
+longest palindromic substring, mapped back to a slice of the original text,
+and the number of palindromic substrings.
+
+Manacher's algorithm reuses the mirror of each centre inside the rightmost
+palindrome found so far, so the inner comparison loop only ever moves the
+right edge forward and the whole scan is O(n). Running this file compares it
+with the O(n^2) expand-around-centre method on two kinds of text: random
+text, where palindromes are short and expanding around each centre stops
+almost at once (so the simpler naive loop is faster), and repeated text
+such as "aaaa...", where every centre expands to the edge and the naive
+method goes quadratic.
+
+Usage:
+    python manacher.py --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+# Seconds the naive method may be projected to take before it is skipped
+DEFAULT_BUDGET = 5.0
+
+TEXT_KINDS = ("random", "repeated")
+
+
+def normalize(text):
+    """
+    Keeps the letters and digits of text, lowercased, and remembers where
+    each one came from.
+
+    :param text: The text to clean.
+    :return: A (cleaned string, array('q') of original indexes) tuple, with
+             one index per character of the cleaned string.
+    """
+    chars = []
+    positions = array("q")
+    for index, ch in enumerate(text):
+        if ch.isalnum():
+            lower = ch.lower()
+            chars.append(lower)
+            # A few characters lowercase to more than one character
+            positions.extend([index] * len(lower))
+    return "".join(chars), positions
+
+
+def radii(s):
+    """
+    Manacher's algorithm.
+
+    :param s: The (already cleaned) string.
+    :return: An (odd, even) tuple of array('i'). odd[i] is the radius of the
+             longest palindrome centred on s[i], counting s[i] itself, so
+             s[i - odd[i] + 1:i + odd[i]] is a palindrome. even[i] is the
+             radius of the longest even palindrome centred between s[i - 1]
+             and s[i], so s[i - even[i]:i + even[i]] is a palindrome.
+    """
+    n = len(s)
+    odd = array("i", [0]) * n
+    even = array("i", [0]) * n
+
+    # [left, right] is the palindrome reaching furthest right so far
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
+
+
+def naiveRadii(s):
+    """
+    The same result as radii, found by expanding around every centre, which
+    takes O(n^2) time in the worst case. Used to check and benchmark radii.
+    """
+    n = len(s)
+    odd = array("i", [0]) * n
+    even = array("i", [0]) * n
+    for i in range(n):
+        k = 1
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        k = 0
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+    return odd, even
+
+
+class PalindromeAnalysis(object):
+    """The maximal palindromes of a text, cleaned like isPalindrome does."""
+
+    def __init__(self, text):
+        """Cleans text and runs Manacher's algorithm over it."""
+        self.text = text
+        self.cleaned, self.positions = normalize(text)
+        self.odd, self.even = radii(self.cleaned)
+
+    def count(self):
+        """Returns the number of palindromic substrings of the cleaned text,
+        counting each position they occur at."""
+        return sum(self.odd) + sum(self.even)
+
+    def longestSpan(self):
+        """
+        Finds the longest palindrome in the cleaned text.
+
+        :return: A (start, stop) tuple for the cleaned text; the first one
+                 found if there is a tie, and (0, 0) if the text is empty.
+        """
+        bestStart, bestStop = 0, 0
+        for i, k in enumerate(self.odd):
+            if 2 * k - 1 > bestStop - bestStart:
+                bestStart, bestStop = i - k + 1, i + k
+        for i, k in enumerate(self.even):
+            if 2 * k > bestStop - bestStart:
+                bestStart, bestStop = i - k, i + k
+        return bestStart, bestStop
+
+    def longest(self):
+        """Returns the slice of the original text holding the longest
+        palindrome, punctuation and case included, or "" if there is none."""
+        start, stop = self.longestSpan()
+        if start == stop:
+            return ""
+        return self.text[self.positions[start]:self.positions[stop - 1] + 1]
+
+    def centredAt(self, i):
+        """Returns the longest odd palindrome centred on character i of the
+        cleaned text."""
+        k = self.odd[i]
+        return self.cleaned[i - k + 1:i + k]
+
+
+def makeText(kind, n, alphabet="ab", seed=0):
+    """
+    Builds a benchmark text.
+
+    :param kind: "random" for n random characters from alphabet, or
+                 "repeated" for the first character of alphabet n times.
+    :param n: Length of the text.
+    :return: The text.
+    :raises ValueError: If the kind is unknown.
+    """
+    if kind == "random":
+        rng = random.Random(seed)
+        return "".join(rng.choice(alphabet) for _ in range(n))
+    if kind == "repeated":
+        return alphabet[0] * n
+    raise ValueError("unknown text kind: " + str(kind))
+
+
+def main(argv=None):
+    """
+    Parses the command line and times Manacher's algorithm against the
+    naive method over texts of growing size.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Manacher's algorithm.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--kinds", nargs="+", choices=TEXT_KINDS, default=list(TEXT_KINDS))
+    parser.add_argument("--alphabet", default="ab")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="skip naive runs projected to take longer than this (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    header = "%-9s %10s %12s %12s %9s %14s %8s" % (
+        "text", "n", "manacher (s)", "naive (s)", "speedup", "palindromes", "longest")
+    print(header)
+    print("-" * len(header))
+    sizes = sorted(args.sizes)
+    for kind in args.kinds:
+        skipping = False
+        for i, n in enumerate(sizes):
+            analysis = PalindromeAnalysis(makeText(kind, n, args.alphabet, args.seed))
+            # Only the radii are timed, so both methods do the same work
+            start = time.perf_counter()
+            radii(analysis.cleaned)
+            fast = time.perf_counter() - start
+
+            slow = "skipped"
+            speedup = "-"
+            if not skipping:
+                start = time.perf_counter()
+                naive = naiveRadii(analysis.cleaned)
+                naiveTime = time.perf_counter() - start
+                if naive != (analysis.odd, analysis.even):
+                    raise AssertionError("naive and Manacher radii differ at n=%d" % n)
+                slow = "%.4f" % naiveTime
+                speedup = "%.1fx" % (naiveTime / fast)
+                # Project at the naive worst case of n^2
+                if i + 1 < len(sizes) and naiveTime * (sizes[i + 1] / n) ** 2 > args.budget:
+                    skipping = True
+
+            start, stop = analysis.longestSpan()
+            print("%-9s %10d %12.4f %12s %9s %14d %8d" % (
+                kind, n, fast, slow, speedup, analysis.count(), stop - start))
+
+
+if __name__ == "__main__":
+    main()
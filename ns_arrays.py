@@ -15,19 +15,39 @@ To instantiate, use
 <variable> = array(<capacity>, <optional fill value>)
 
 The fill value is None by default.
+
+Numeric data can be stored in typed, contiguous memory instead:
+
+<variable> = Array(<capacity>, <optional fill value>, typecode=<code>)
+
+where code is an array.array typecode such as "q" (64-bit ints) or "d"
+(floats). Each item then takes its itemsize in bytes (8 for "q" and "d")
+instead of a list slot plus an int or float object, the fill is one bulk
+copy, and the items can be shared without copying through view(), which
+returns a memoryview on every Python version (memoryview(array) directly
+only works on 3.12+). bytes(array) gives the raw item bytes everywhere.
 """
 
 import random
+from array import array
 
 class Array(object):
-    """Represents an array."""
+    """Represents an array.
+    For a typed array, view() is the portable way to get a buffer; the
+    __buffer__ hook behind memoryview(array) needs Python 3.12+."""
 
-    def __init__(self, capacity, fillValue = None):
+    def __init__(self, capacity, fillValue = None, typecode = None):
         """Capacity is the static size of the array.
-        fillValue is placed at each position."""
-        self._items = list()
-        for count in range(capacity):
-            self._items.append(fillValue)
+        fillValue is placed at each position.
+        typecode, if given, is an array.array typecode for numeric items;
+        the fill value then defaults to 0."""
+        self._typecode = typecode
+        if typecode is None:
+            self._items = [fillValue] * capacity
+        else:
+            if fillValue is None:
+                fillValue = 0
+            self._items = array(typecode, [fillValue]) * capacity
 
     def __len__(self):
         """-> The capacity of the array."""
@@ -35,7 +55,9 @@ class Array(object):
 
     def __str__(self):
         """-> The string representation of the array."""
-        return str(self._items)
+        if self._typecode is None:
+            return str(self._items)
+        return str(self._items.tolist())
 
     def __iter__(self):
         """Supports iteration over a view of an array."""
@@ -49,6 +71,33 @@ class Array(object):
         """Subscript operator for replacement at index."""
         self._items[index] = newItem
 
+    @property
+    def typecode(self):
+        """-> The array.array typecode, or None for a list of objects."""
+        return self._typecode
+
+    def view(self, start = None, stop = None):
+        """Returns a memoryview of items start..stop-1, sharing memory with
+        the array, so slicing it copies nothing.
+        Raises: TypeError if the array has no typecode."""
+        return self.__buffer__(0)[start:stop]
+
+    def __buffer__(self, flags):
+        """Buffer protocol (Python 3.12+): memoryview(array) works directly
+        on a typed array.
+        Raises: TypeError if the array has no typecode."""
+        if self._typecode is None:
+            raise TypeError("only an Array with a typecode supports the buffer protocol")
+        return memoryview(self._items)
+
+    def __bytes__(self):
+        """-> The raw bytes of a typed array's items, the same on every
+        Python version. Without a typecode each item must be an int in
+        0..255, as for bytes(list)."""
+        if self._typecode is None:
+            return bytes(self._items)
+        return self._items.tobytes()
+
     def __eq__(self, other):
         """Runs when an Array is the left operand of ==.
         Returns True if other is an Array, has the same logical size,
@@ -57,16 +106,18 @@ class Array(object):
             return False
         if len(self) != len(other):
             return False
-        for i in range(len(self)):
-            if self[i] != other[i]:
+        # Same storage type: let the list or array compare in one call
+        if type(self._items) is type(other._items):
+            return self._items == other._items
+        for mine, theirs in zip(self._items, other._items):
+            if mine != theirs:
                 return False
         return True
 
     def clone(self):
-        """Returns a deep copy of the Array."""
-        newArray = Array(len(self))
-        for i in range(len(self)):
-            newArray[i] = self[i]
+        """Returns a copy of the Array, with the same typecode."""
+        newArray = Array(0, typecode = self._typecode)
+        newArray._items = self._items[:]
         return newArray
 
 
@@ -0,0 +1,170 @@
+"""
+Name: Neel Srivastava
+Project: NumPy sorting backend
+Date: 18/10/26
+Summary: Optional NumPy versions of the sorting benchmark. The data is made
+with numpy.random.Generator and kept as an int64 ndarray, and each function
+sorts that array in place with whole-array operations: numpy's own sort
+kinds, a quick sort whose partition step is done with boolean masks, and an
+LSD radix sort over 16-bit digits. sort_benchmark.py puts their times in the
+same table as the pure-Python sorts, so the gap shows how much of the cost
+is interpreter overhead.
+
+NumPy is not required. Without it this module still imports, HAVE_NUMPY is
+False, and the benchmark leaves these algorithms out.
+"""
+
+import zlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sort_benchmark import DISTRIBUTIONS, HIGH_VALUE, LOW_VALUE
+
+
+HAVE_NUMPY = numpy is not None
+
+# Segments this size or smaller are finished with numpy's own sort
+SMALL_SEGMENT = 1024
+# Radix sort looks at this many bits of each key per pass
+RADIX_BITS = 16
+
+
+def _requireNumpy():
+    if numpy is None:
+        raise ImportError("numpy is required for the numpy_sorts backend")
+
+
+def makeArray(distribution, n, seed=0):
+    """
+    Builds a reproducible int64 array with the given shape, using the same
+    distributions and value range as sort_benchmark.makeData.
+
+    :param distribution: One of sort_benchmark.DISTRIBUTIONS.
+    :param n: Number of items in the array.
+    :param seed: Extra seed so different runs can use different data.
+    :return: A new int64 ndarray of n items.
+    :raises ValueError: If the distribution name is unknown.
+    :raises ImportError: If NumPy is not installed.
+    """
+    _requireNumpy()
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("unknown distribution: " + str(distribution))
+    rng = numpy.random.default_rng(zlib.crc32(("%s:%d:%d" % (distribution, n, seed)).encode()))
+
+    if distribution == "few_unique":
+        values = rng.integers(LOW_VALUE, HIGH_VALUE, size=10, endpoint=True, dtype=numpy.int64)
+        return rng.choice(values, size=n)
+
+    data = rng.integers(LOW_VALUE, HIGH_VALUE, size=n, endpoint=True, dtype=numpy.int64)
+    if distribution == "random":
+        return data
+
+    data.sort()
+    if distribution == "reversed":
+        data = data[::-1].copy()
+    elif distribution == "nearly_sorted" and n > 1:
+        # Swap about 1% of the positions so the array is almost in order
+        count = max(1, n // 100)
+        i = rng.integers(0, n, size=count)
+        j = rng.integers(0, n, size=count)
+        data[i], data[j] = data[j].copy(), data[i].copy()
+    return data
+
+
+def isSorted(arr):
+    """Returns True if the array is in non-descending order."""
+    return bool(numpy.all(arr[:-1] <= arr[1:]))
+
+
+def quickSort(arr):
+    """Sorts the array in place with numpy's introsort ("quicksort" kind)."""
+    arr.sort(kind="quicksort")
+    return arr
+
+
+def mergeSort(arr):
+    """Sorts the array in place with numpy's stable sort ("stable" kind)."""
+    arr.sort(kind="stable")
+    return arr
+
+
+def heapSort(arr):
+    """Sorts the array in place with numpy's heap sort ("heapsort" kind)."""
+    arr.sort(kind="heapsort")
+    return arr
+
+
+def partitionSort(arr):
+    """
+    Quick sort where each partition step is a few whole-array operations.
+
+    Pending segments are kept on a stack, like intro_sort in 3.4.py. The
+    pivot is the median of nine evenly spaced items, and the segment is split
+    three ways with boolean masks: items below the pivot, copies of the
+    pivot, and items above it. Segments of SMALL_SEGMENT items or fewer are
+    finished with numpy's own sort.
+
+    :param arr: The int64 array to sort in place.
+    :return: The same array, now sorted.
+    """
+    stack = [(0, len(arr))]
+    while stack:
+        low, high = stack.pop()
+        segment = arr[low:high]
+        size = high - low
+        if size <= SMALL_SEGMENT:
+            segment.sort(kind="quicksort")
+            continue
+
+        sample = numpy.sort(segment[numpy.linspace(0, size - 1, 9).astype(numpy.intp)])
+        pivot = sample[4]
+        less = segment[segment < pivot]
+        greater = segment[segment > pivot]
+        lessEnd = len(less)
+        greaterStart = size - len(greater)
+
+        segment[:lessEnd] = less
+        segment[lessEnd:greaterStart] = pivot
+        segment[greaterStart:] = greater
+
+        if lessEnd > 1:
+            stack.append((low, low + lessEnd))
+        if size - greaterStart > 1:
+            stack.append((low + greaterStart, high))
+    return arr
+
+
+def radixSort(arr):
+    """
+    LSD radix sort over RADIX_BITS-bit digits.
+
+    Flipping the sign bit turns the int64 values into uint64 keys in the
+    same order, and the smallest key is subtracted so only the digits that
+    actually vary get a pass. Each pass is a stable argsort of one digit
+    (numpy itself uses a counting sort for 16-bit keys) followed by one
+    gather of the keys.
+
+    :param arr: The int64 array to sort in place.
+    :return: The same array, now sorted.
+    """
+    if len(arr) < 2:
+        return arr
+
+    signBit = numpy.uint64(1 << 63)
+    keys = arr.view(numpy.uint64) ^ signBit
+    smallest = keys.min()
+    keys -= smallest
+
+    mask = numpy.uint64((1 << RADIX_BITS) - 1)
+    digitType = numpy.uint16 if RADIX_BITS <= 16 else numpy.uint32
+    for shift in range(0, int(keys.max()).bit_length(), RADIX_BITS):
+        digits = ((keys >> numpy.uint64(shift)) & mask).astype(digitType)
+        keys = keys[numpy.argsort(digits, kind="stable")]
+
+    keys += smallest
+    keys ^= signBit
+    arr[:] = keys.view(numpy.int64)
+    return arr
@@ -4,8 +4,64 @@ Date: 6/3/26
 Assignment: Palindrome, 7.2
 Summary: The program checks inputted strings to see if they are palindromes, utilizes stack implementation.
 Has a menu with a palindrome checker operation as well as a quit operation
+
+isPalindromeFile checks a whole file without reading it into memory: the
+file is memory-mapped and read a block at a time from both ends at once,
+each block is cleaned and lowercased with one bytes.translate call, and the
+two ends are compared as they come in, stopping at the first mismatch.
+Memory stays at a couple of blocks and time is linear, so multi-GB files
+are fine. Running "python palindrome.py FILE..." checks files this way.
+
+StreamingPalindromeDetector answers the same question for input that
+arrives a chunk at a time and may never end, keeping only two pairs of
+rolling hashes instead of the text.
+
+palindromePairs finds every ordered pair of words whose concatenation is a
+palindrome, using a hash map from each cleaned word to its positions instead
+of trying all n^2 pairs. "python palindrome.py --pairs WORDS" runs it over a
+word list file, one word per line.
 """
 
+import codecs
+import mmap
+import random
+import sys
+from array import array, typecodes
+
+
+# Bytes read from each end of a file at a time
+FILE_BLOCK = 1024 * 1024
+
+_ASCII_UPPER = bytes(range(ord("A"), ord("Z") + 1))
+_ASCII_ALNUM = bytes(range(ord("0"), ord("9") + 1)) + _ASCII_UPPER + _ASCII_UPPER.lower()
+# Lowercases ASCII letters
+LOWER_TABLE = bytes.maketrans(_ASCII_UPPER, _ASCII_UPPER.lower())
+# Every byte that is not an ASCII letter or digit
+NON_ALNUM = bytes(b for b in range(256) if b not in _ASCII_ALNUM)
+
+
+def _charTypecode():
+    """
+    Pick the array typecode for a stack of characters.
+
+    "w" (always 4 bytes) is new in Python 3.13. Older versions only have
+    "u", a wchar_t, which is 2 bytes on Windows: characters outside the
+    Basic Multilingual Plane are then stored as two surrogate halves, and
+    reversing the array would swap them. In that case the stack keeps a
+    list instead.
+
+    :return: "w", "u", or None for the list backend.
+    """
+    if "w" in typecodes:
+        return "w"
+    if array("u").itemsize >= 4:
+        return "u"
+    return None
+
+
+# array typecode for one character per item, or None for a list
+CHAR_TYPECODE = _charTypecode()
+
 
 class Stack:
     """A simple stack implementation using a Python list."""
@@ -61,12 +117,127 @@ class Stack:
         return len(self._data)
 
 
+class CompactStack:
+    """
+    A stack with the same methods as Stack, plus bulk operations.
+
+    Items live in a list, or, given a typecode, in an array.array, which
+    stores characters (CHAR_TYPECODE) or numbers ("i", "q", "d", ...) in a
+    few bytes each instead of one object pointer per item. __slots__ keeps
+    the stack itself small, and pop and peek let the empty check happen
+    inside the list or array instead of calling is_empty first.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, typecode=None, items=()):
+        """
+        Create a stack, optionally filled from items (the last item on top).
+
+        :param typecode: An array.array typecode, or None for a list.
+        :param items: Items to push, bottom first.
+        """
+        self._data = list(items) if typecode is None else array(typecode, items)
+
+    def push(self, item):
+        """
+        Push an item onto the top of the stack.
+
+        :param item: The item to push onto the stack.
+        :return: None
+        """
+        self._data.append(item)
+
+    def pop(self):
+        """
+        Remove and return the top item of the stack.
+
+        :return: The item at the top of the stack.
+        :raises IndexError: If the stack is empty.
+        """
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise IndexError("pop from an empty stack") from None
+
+    def peek(self):
+        """
+        Return the top item without removing it.
+
+        :return: The item at the top of the stack.
+        :raises IndexError: If the stack is empty.
+        """
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise IndexError("peek at an empty stack") from None
+
+    def is_empty(self):
+        """
+        Check whether the stack contains no items.
+
+        :return: True if the stack is empty, False otherwise.
+        """
+        return not self._data
+
+    def size(self):
+        """
+        Return the number of items currently in the stack.
+
+        :return: Integer count of items in the stack.
+        """
+        return len(self._data)
+
+    def __len__(self):
+        """Return the number of items currently in the stack."""
+        return len(self._data)
+
+    def push_many(self, items):
+        """
+        Push every item in order, so the last one ends up on top.
+        A str can be pushed in one go onto a character stack.
+
+        :param items: An iterable of items.
+        :return: None
+        """
+        if isinstance(items, str) and isinstance(self._data, array):
+            self._data.fromunicode(items)
+        else:
+            self._data.extend(items)
+
+    def pop_many(self, count):
+        """
+        Remove the top count items.
+
+        :param count: How many items to pop.
+        :return: A list or array of the popped items, top item first.
+        :raises IndexError: If the stack has fewer than count items.
+        """
+        if count > len(self._data):
+            raise IndexError("pop_many(%d) from a stack of %d items" % (count, len(self._data)))
+        if count <= 0:
+            return self._data[:0]
+        items = self._data[:-count - 1:-1]
+        del self._data[-count:]
+        return items
+
+    def drain(self):
+        """
+        Remove every item.
+
+        :return: A list or array of all the items, top item first.
+        """
+        items = self._data[::-1]
+        del self._data[:]
+        return items
+
+
 def isPalindrome(text: str):
     """
     Determine whether a string is a palindrome using a stack.
 
     Normalises the input to lowercase alphanumeric characters, pushes
-    each character onto a stack, then pops them off to form the reversed
+    them onto a character CompactStack, then drains it to form the reversed
     string, and compares it to the original normalised string.
 
     :param text: The string to test for palindrome property.
@@ -77,15 +248,242 @@ def isPalindrome(text: str):
     if len(cleaned) == 0:
         return True
 
-    stack = Stack()
-    for ch in cleaned:
-        stack.push(ch)
+    stack = CompactStack(CHAR_TYPECODE)
+    stack.push_many(cleaned)
+    # Draining pops every character at once, already in reverse order
+    reversedChars = stack.drain()
+    if CHAR_TYPECODE is None:
+        return cleaned == "".join(reversedChars)
+    return cleaned == reversedChars.tounicode()
+
+
+def _isPalindromeBuffer(data, blockSize=FILE_BLOCK):
+    """
+    Two-pointer palindrome check over a bytes-like object, such as an mmap.
+
+    Blocks are taken from whichever end has less cleaned text waiting, so at
+    most about one block per end is held at a time. When the two pointers
+    meet, whatever is left over is the middle of the cleaned text and must
+    be a palindrome on its own.
+
+    :param data: The bytes to check.
+    :param blockSize: Bytes taken from an end at a time.
+    :return: True if the ASCII letters and digits read the same both ways.
+    """
+    low = 0
+    high = len(data)
+    front = b""
+    back = b""
+    while low < high:
+        if len(front) <= len(back):
+            stop = min(low + blockSize, high)
+            front += data[low:stop].translate(LOWER_TABLE, NON_ALNUM)
+            low = stop
+        else:
+            start = max(high - blockSize, low)
+            back += data[start:high].translate(LOWER_TABLE, NON_ALNUM)[::-1]
+            high = start
+        size = min(len(front), len(back))
+        if front[:size] != back[:size]:
+            return False
+        front = front[size:]
+        back = back[size:]
+    middle = front or back
+    return middle == middle[::-1]
+
+
+def isPalindromeFile(path, blockSize=FILE_BLOCK):
+    """
+    Determine whether a file is a palindrome, ignoring case and anything that
+    is not a letter or digit, without reading the file into memory.
+
+    Only ASCII letters and digits are compared; every other byte, including
+    the bytes of non-ASCII UTF-8 characters, is skipped. isPalindrome, which
+    works on str, also counts non-ASCII letters.
+
+    :param path: The file to check.
+    :param blockSize: Bytes read from each end at a time.
+    :return: True if the file is a palindrome, False otherwise.
+    """
+    with open(path, "rb") as file:
+        # mmap cannot map an empty file
+        if file.seek(0, 2) == 0:
+            return True
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _isPalindromeBuffer(data, blockSize)
+
+
+class StreamingPalindromeDetector:
+    """
+    Tells whether the text fed in so far is a palindrome, in O(1) time and
+    memory, with the same cleaning rules as isPalindrome.
+
+    For the cleaned characters c0 .. c(n-1) it keeps a forward hash
+    c0*B^(n-1) + ... + c(n-1) and a reverse hash c0 + c1*B + ... + c(n-1)*B^(n-1),
+    both modulo the prime 2^61 - 1. Each new character updates both in O(1),
+    and the two are equal exactly when the text reads the same both ways,
+    apart from hash collisions. Two independent random bases are used, so a
+    false match needs both to collide, with a chance of roughly (n / 2^61)^2;
+    the text itself is never stored, so a match cannot be re-checked.
+
+    Chunks can be str, or bytes decoded as UTF-8 (a character split between
+    two chunks is handled). Pure-ASCII bytes are cleaned with one
+    bytes.translate call.
+    """
+
+    MOD = (1 << 61) - 1
+
+    __slots__ = ("_bases", "_forward", "_reverse", "_powers", "_length", "_decoder")
+
+    def __init__(self):
+        """Starts with an empty text, which counts as a palindrome."""
+        rng = random.SystemRandom()
+        self._bases = (rng.randrange(256, self.MOD - 1), rng.randrange(256, self.MOD - 1))
+        self._forward = [0, 0]
+        self._reverse = [0, 0]
+        # B^n for each base, the weight of the next character in the reverse hash
+        self._powers = [1, 1]
+        self._length = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def __len__(self):
+        """Return how many cleaned characters have been seen."""
+        return self._length
+
+    def _update(self, codes):
+        """Adds a sequence of character codes to both pairs of hashes."""
+        mod = self.MOD
+        for k in (0, 1):
+            base = self._bases[k]
+            forward = self._forward[k]
+            reverse = self._reverse[k]
+            power = self._powers[k]
+            for code in codes:
+                forward = (forward * base + code) % mod
+                reverse = (reverse + code * power) % mod
+                power = power * base % mod
+            self._forward[k] = forward
+            self._reverse[k] = reverse
+            self._powers[k] = power
+        self._length += len(codes)
 
-    reversed_str = ""
-    while not stack.is_empty():
-        reversed_str += stack.pop()
+    def _feedText(self, text):
+        """Cleans a str and adds it."""
+        if text.isascii():
+            self._update(text.encode("ascii").translate(LOWER_TABLE, NON_ALNUM))
+        else:
+            self._update([ord(ch) for ch in "".join(ch.lower() for ch in text if ch.isalnum())])
+
+    def feed(self, chunk):
+        """
+        Add the next chunk of the stream.
+
+        :param chunk: A str, or bytes in UTF-8.
+        :return: True if everything fed so far is a palindrome.
+        """
+        if isinstance(chunk, str):
+            self._feedText(chunk)
+        elif chunk.isascii() and not self._decoder.getstate()[0]:
+            self._update(chunk.translate(LOWER_TABLE, NON_ALNUM))
+        else:
+            self._feedText(self._decoder.decode(chunk))
+        return self.is_palindrome()
+
+    def is_palindrome(self):
+        """
+        Check in O(1) whether the text fed so far is a palindrome.
+
+        :return: True if the cleaned prefix reads the same both ways.
+        """
+        return self._forward == self._reverse
+
+    def finish(self):
+        """
+        End the stream, decoding any bytes still waiting in the UTF-8 decoder.
+
+        :return: True if the whole stream is a palindrome.
+        """
+        self._feedText(self._decoder.decode(b"", final=True))
+        return self.is_palindrome()
+
+
+def isPalindromeStream(chunks):
+    """
+    Determine whether a stream of chunks is a palindrome without storing it.
+
+    :param chunks: An iterable of str or UTF-8 bytes chunks, such as a
+                   generator or iter(lambda: sock.recv(65536), b"").
+    :return: True if the whole stream is a palindrome, False otherwise.
+    """
+    detector = StreamingPalindromeDetector()
+    for chunk in chunks:
+        detector.feed(chunk)
+    return detector.finish()
+
+
+def cleanWord(word):
+    """
+    Normalise a word the way isPalindrome does: keep letters and digits,
+    lowercased.
+
+    :param word: The word to clean.
+    :return: The cleaned word.
+    """
+    if word.isascii():
+        return word.encode("ascii").translate(LOWER_TABLE, NON_ALNUM).decode("ascii")
+    return "".join(ch.lower() for ch in word if ch.isalnum())
+
+
+def loadWords(path):
+    """
+    Stream the words of a word list file, one per line, without reading
+    the whole file at once. Blank lines are skipped.
+
+    :param path: The word list file, in UTF-8.
+    :return: A generator of words.
+    """
+    with open(path, encoding="utf-8", buffering=FILE_BLOCK) as file:
+        for line in file:
+            word = line.strip()
+            if word:
+                yield word
+
+
+def palindromePairs(words):
+    """
+    Find every ordered pair (i, j), i != j, for which words[i] + words[j] is
+    a palindrome under the isPalindrome rules.
+
+    Every cleaned word goes into a dict from the word to the positions it
+    appears at. Then each word w is cut at every point into w[:c] + w[c:]:
+    if w[:c] is a palindrome, any word equal to reversed(w[c:]) can go in
+    front of w; if w[c:] is a palindrome, any word equal to reversed(w[:c])
+    can go after it. That is O(k) dict lookups and O(k) palindrome checks of
+    length O(k) per word, so O(n * k^2) in all instead of O(n^2 * k).
+
+    :param words: An iterable of words, for example loadWords(path).
+    :return: A generator of (i, j) pairs of positions in words.
+    """
+    cleaned = [cleanWord(word) for word in words]
+    index = {}
+    for i, word in enumerate(cleaned):
+        index.setdefault(word, []).append(i)
 
-    return cleaned == reversed_str
+    for i, word in enumerate(cleaned):
+        size = len(word)
+        for cut in range(size + 1):
+            prefix = word[:cut]
+            suffix = word[cut:]
+            if prefix == prefix[::-1]:
+                for j in index.get(suffix[::-1], ()):
+                    if j != i:
+                        yield j, i
+            # At cut == size the suffix is empty, the same pair as the
+            # prefix case at cut == 0 of the other word
+            if cut != size and suffix == suffix[::-1]:
+                for j in index.get(prefix[::-1], ()):
+                    if j != i:
+                        yield i, j
 
 
 def main():
@@ -114,4 +512,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) == 3 and sys.argv[1] == "--pairs":
+        wordList = list(loadWords(sys.argv[2]))
+        for i, j in palindromePairs(wordList):
+            print(wordList[i], wordList[j])
+    elif len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            print(path + ":", "IS a palindrome" if isPalindromeFile(path) else "is NOT a palindrome")
+    else:
+        main()
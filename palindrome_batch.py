@@ -0,0 +1,206 @@
+"""
+Name: Neel Srivastava
+Project: Batch palindrome classification
+Date: 18/10/26
+Summary: Classifies many strings at once, with the same rules as
+palindrome.isPalindrome (only letters and digits count, case is ignored)
+but without building a Stack or a generator per string. ASCII strings take
+a fast path: one bytes.translate call with the tables from palindrome.py
+drops everything but letters and digits and lowercases what is left, and
+the result is compared with its own reverse slice. Other strings fall back
+to the isalnum loop, so non-ASCII letters still count.
+
+Results are a compact bitmap: bit i (bit i % 8 of byte i // 8) is set when
+string i is a palindrome. The file mode reads lines as bytes, hands chunks
+of lines to a process pool, and writes either the raw bitmap or the list of
+palindromic line indexes (counting from 0).
+
+Usage:
+    python palindrome_batch.py corpus.txt -o palindromes.txt --workers 4
+    python palindrome_batch.py corpus.txt -o bitmap.bin --format bitmap
+"""
+
+import argparse
+import os
+import sys
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+from palindrome import LOWER_TABLE, NON_ALNUM
+
+
+# Lines per chunk; a multiple of 8 so chunk bitmaps join byte for byte
+DEFAULT_CHUNK_LINES = 65536
+IO_BUFFER = 1024 * 1024
+FORMATS = ("indexes", "bitmap")
+
+
+def isPalindromeText(text):
+    """
+    The same answer as palindrome.isPalindrome, with an ASCII fast path.
+
+    :param text: The string to test.
+    :return: True if text is a palindrome, False otherwise.
+    """
+    if text.isascii():
+        cleaned = text.encode("ascii").translate(LOWER_TABLE, NON_ALNUM)
+    else:
+        cleaned = "".join(ch.lower() for ch in text if ch.isalnum())
+    return cleaned == cleaned[::-1]
+
+
+def isPalindromeLine(line):
+    """
+    Tests one line of a file read in binary, ignoring its line ending.
+    Lines that are not ASCII are decoded as UTF-8 and use the slow path.
+
+    :param line: The line as bytes.
+    :return: True if the line is a palindrome, False otherwise.
+    """
+    if line.isascii():
+        cleaned = line.translate(LOWER_TABLE, NON_ALNUM)
+        return cleaned == cleaned[::-1]
+    return isPalindromeText(line.decode("utf-8", "replace"))
+
+
+def packBits(flags):
+    """Packs a list of booleans into a bitmap, flag i going to bit i % 8 of
+    byte i // 8."""
+    if not flags:
+        return b""
+    # The binary digits are written highest index first, so the number's
+    # little-endian bytes hold flag 0 in the lowest bit
+    number = int("".join(["1" if flag else "0" for flag in reversed(flags)]), 2)
+    return number.to_bytes((len(flags) + 7) // 8, "little")
+
+
+def bitmapIndexes(bitmap, count=None):
+    """
+    Lists the indexes of the set bits in a bitmap made by packBits.
+
+    :param bitmap: The bitmap bytes.
+    :param count: How many bits are in use, or None for all of them.
+    :return: A list of indexes, in increasing order.
+    """
+    if count is None:
+        count = len(bitmap) * 8
+    indexes = []
+    for byteIndex, byte in enumerate(bitmap):
+        if byte:
+            base = byteIndex * 8
+            for bit in range(8):
+                if byte >> bit & 1 and base + bit < count:
+                    indexes.append(base + bit)
+    return indexes
+
+
+def classify(texts):
+    """
+    Classifies a sequence of strings.
+
+    :param texts: The strings to test.
+    :return: A bitmap with bit i set when texts[i] is a palindrome.
+    """
+    return packBits([isPalindromeText(text) for text in texts])
+
+
+def _classifyChunk(lines):
+    """Worker body: returns the bitmap, palindrome count and line count for
+    a chunk of byte lines."""
+    flags = [isPalindromeLine(line.rstrip(b"\r\n")) for line in lines]
+    return packBits(flags), sum(flags), len(flags)
+
+
+def readChunks(file, chunkLines=DEFAULT_CHUNK_LINES):
+    """Reads a binary file chunkLines lines at a time, as lists of bytes."""
+    while True:
+        chunk = list(islice(file, chunkLines))
+        if not chunk:
+            break
+        yield chunk
+
+
+class BatchStats(object):
+    """Counters for one file classification."""
+
+    def __init__(self):
+        self.lines = 0
+        self.palindromes = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        """Returns the counters and the throughput as a short report."""
+        return "lines: %d\npalindromes: %d\nseconds: %.3f\nlines/s: %.0f" % (
+            self.lines, self.palindromes, self.seconds,
+            self.lines / (self.seconds or 1e-9))
+
+
+def classifyFile(path, workers=1, chunkLines=DEFAULT_CHUNK_LINES):
+    """
+    Classifies every line of a file.
+
+    :param path: The file, one string per line.
+    :param workers: Processes to use; 1 classifies in this process.
+    :param chunkLines: Lines per chunk, rounded up to a multiple of 8.
+    :return: A (bitmap, BatchStats) tuple.
+    """
+    chunkLines = max(8, (chunkLines + 7) // 8 * 8)
+    stats = BatchStats()
+    start = time.perf_counter()
+    bitmap = bytearray()
+    with open(path, "rb", buffering=IO_BUFFER) as file:
+        chunks = readChunks(file, chunkLines)
+        pool = Pool(workers) if workers > 1 else None
+        try:
+            if pool is None:
+                results = map(_classifyChunk, chunks)
+            else:
+                # imap keeps the chunks in file order
+                results = pool.imap(_classifyChunk, chunks)
+            for chunkBitmap, palindromes, lines in results:
+                bitmap += chunkBitmap
+                stats.palindromes += palindromes
+                stats.lines += lines
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    stats.seconds = time.perf_counter() - start
+    return bitmap, stats
+
+
+def main(argv=None):
+    """
+    Parses the command line, classifies the file, writes the result, and
+    prints the stats on stderr.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Find the palindromic lines of a file.")
+    parser.add_argument("input")
+    parser.add_argument("-o", "--output", help="output file (default stdout)")
+    parser.add_argument("--format", choices=FORMATS, default="indexes",
+                        help="line indexes, one per line, or the raw bitmap")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    args = parser.parse_args(argv)
+
+    bitmap, stats = classifyFile(args.input, args.workers, args.chunk_lines)
+
+    if args.format == "bitmap":
+        data = bytes(bitmap)
+    else:
+        indexes = bitmapIndexes(bitmap, stats.lines)
+        data = "".join("%d\n" % index for index in indexes).encode()
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+    print(stats, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
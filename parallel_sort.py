@@ -0,0 +1,111 @@
+"""
+Name: Neel Srivastava
+Project: Multi-core parallel sort
+Date: 18/10/26
+Summary: Sorts a list of integers on several cores. The list is copied once
+into a shared memory block of 64-bit integers, each worker process sorts its
+own slice of that block in place with one of the sorts from 3.4.py, and the
+sorted slices are combined with a heap-based k-way merge. The slices are
+never pickled, only the shared memory name and the slice bounds are sent to
+the workers. Small lists, or machines with one core, use the ordinary
+single-process sort instead.
+"""
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import sorts
+
+
+# Sort from 3.4.py used on each chunk and on the single-process path
+DEFAULT_ALGORITHM = "radixSort"
+# Lists shorter than this are sorted in a single process
+PARALLEL_THRESHOLD = 100000
+# Each worker gets at least this many items
+MIN_CHUNK = 25000
+
+
+def chooseWorkers(n, threshold=PARALLEL_THRESHOLD):
+    """
+    Picks how many worker processes to use for a list of n items.
+
+    :param n: The length of the list.
+    :param threshold: Lists shorter than this get a single process.
+    :return: The number of processes, 1 meaning no pool at all.
+    """
+    if n < threshold:
+        return 1
+    return max(1, min(os.cpu_count() or 1, n // MIN_CHUNK))
+
+
+def _sortChunk(memoryName, start, stop, algorithm):
+    """
+    Worker body: sorts items start..stop-1 of the shared block in place.
+
+    :param memoryName: The name of the SharedMemory block holding the items.
+    :param start: First index of the chunk.
+    :param stop: End of the chunk (not included).
+    :param algorithm: Name of a list sort in 3.4.py.
+    :return: None
+    """
+    memory = shared_memory.SharedMemory(name=memoryName)
+    view = memory.buf.cast("q")
+    try:
+        chunk = view[start:stop].tolist()
+        getattr(sorts, algorithm)(chunk)
+        view[start:stop] = array("q", chunk)
+    finally:
+        view.release()
+        memory.close()
+
+
+def parallelSort(arr, workers=None, algorithm=DEFAULT_ALGORITHM,
+                 threshold=PARALLEL_THRESHOLD):
+    """
+    Sorts a list of integers in place using several processes.
+
+    The items must fit in a signed 64-bit integer, since that is the format
+    of the shared block.
+
+    :param arr: The list of integers to sort.
+    :param workers: Number of processes, or None to pick with chooseWorkers.
+    :param algorithm: Name of the 3.4.py list sort used for each chunk.
+    :param threshold: Lists shorter than this are sorted in one process.
+    :return: The same list, now sorted.
+    :raises OverflowError: If an item does not fit in 64 bits.
+    """
+    n = len(arr)
+    if workers is None:
+        workers = chooseWorkers(n, threshold)
+    if workers < 2 or n < max(threshold, workers):
+        getattr(sorts, algorithm)(arr)
+        return arr
+
+    data = array("q", arr)
+    memory = shared_memory.SharedMemory(create=True, size=data.itemsize * n)
+    view = memory.buf.cast("q")
+    chunks = []
+    try:
+        view[:] = data
+        del data
+
+        bounds = [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sortChunk, memory.name, start, stop, algorithm)
+                       for start, stop in bounds]
+            for future in futures:
+                future.result()
+
+        chunks = [view[start:stop] for start, stop in bounds]
+        arr[:] = heapq.merge(*chunks)
+    finally:
+        for chunk in chunks:
+            chunk.release()
+        view.release()
+        memory.close()
+        memory.unlink()
+
+    return arr
@@ -0,0 +1,146 @@
+"""
+Name: Neel Srivastava
+Project: Scanner for the infix-to-postfix converter
+Date: 18/10/26
+Summary: Splits an infix expression into Tokens in a single pass. One
+regular expression finds every number, every variable name and every other
+non-blank character, and each symbol is looked up in Token.OPERATORS, so
+operators are never rebuilt. Numbers are non-negative integers and variable
+names are ASCII identifiers; any other character raises ValueError with its
+position.
+
+StreamScanner does the same over a file read in fixed-size chunks, so an
+expression far bigger than memory can be scanned. A number or name cut in
+two at the end of a chunk is carried over to the next one.
+"""
+
+import re
+
+from tokens import Token
+
+
+# A run of digits, an identifier, or any single character that is not whitespace
+TOKEN_PATTERN = re.compile(r"[0-9]+|[A-Za-z_][A-Za-z_0-9]*|\S")
+# Number or name characters at the very end of a chunk, which may go on
+# in the next chunk
+TRAILING_WORD = re.compile(r"[A-Za-z_0-9]+\Z")
+
+# Characters read per chunk by StreamScanner
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def scanText(sourceStr, offset=0):
+    """
+    Returns the list of tokens in sourceStr.
+
+    :param sourceStr: The text to scan.
+    :param offset: Position of sourceStr in the whole expression, used in
+                   error messages.
+    :return: A list of Tokens.
+    :raises ValueError: On a character that is not part of a number or name,
+                        an operator, a parenthesis or whitespace.
+    """
+    operators = Token.OPERATORS
+    tokens = []
+    append = tokens.append
+    for text in TOKEN_PATTERN.findall(sourceStr):
+        token = operators.get(text)
+        if token is None:
+            first = text[0]
+            if "0" <= first <= "9":
+                token = Token(int(text))
+            elif first == "_" or "a" <= first.lower() <= "z":
+                token = Token(text)
+            else:
+                # The first copy of a bad character is the one that failed
+                raise ValueError("unexpected character %r at position %d"
+                                 % (text, offset + sourceStr.index(text)))
+        append(token)
+    return tokens
+
+
+def scanChunks(chunks):
+    """
+    Scans an expression given as a sequence of text chunks.
+
+    :param chunks: An iterable of strings which together make up the expression.
+    :return: A generator of Tokens; only one chunk's tokens are held at once.
+    :raises ValueError: As scanText, with the position in the whole expression.
+    """
+    pending = ""
+    offset = 0
+    for chunk in chunks:
+        text = pending + chunk
+        match = TRAILING_WORD.search(text)
+        if match:
+            pending = text[match.start():]
+            text = text[:match.start()]
+        else:
+            pending = ""
+        yield from scanText(text, offset)
+        offset += len(text)
+    if pending:
+        yield from scanText(pending, offset)
+
+
+class Scanner(object):
+    """Hands out the tokens of an expression one at a time."""
+
+    def __init__(self, sourceStr):
+        """Tokenizes sourceStr. Raises ValueError on a character that is
+        not part of a number or name, an operator, a parenthesis or whitespace."""
+        self.sourceStr = sourceStr
+        self._tokens = scanText(sourceStr)
+        self._index = 0
+
+    def __len__(self):
+        """Returns the number of tokens in the whole expression."""
+        return len(self._tokens)
+
+    def hasNext(self):
+        """Returns True if there are tokens left."""
+        return self._index < len(self._tokens)
+
+    def next(self):
+        """Returns the next token. Raises StopIteration at the end."""
+        if self._index >= len(self._tokens):
+            raise StopIteration("no more tokens")
+        token = self._tokens[self._index]
+        self._index += 1
+        return token
+
+    def __iter__(self):
+        """Iterates over the tokens that have not been read yet."""
+        tokens = self._tokens[self._index:]
+        self._index = len(self._tokens)
+        return iter(tokens)
+
+
+class StreamScanner(object):
+    """Hands out the tokens of an expression read lazily from a file."""
+
+    def __init__(self, file, chunkSize=DEFAULT_CHUNK_SIZE):
+        """Scans the open text file, chunkSize characters at a time, as
+        the tokens are asked for."""
+        self._tokens = scanChunks(iter(lambda: file.read(chunkSize), ""))
+        self._lookahead = None
+
+    def hasNext(self):
+        """Returns True if there are tokens left."""
+        if self._lookahead is None:
+            self._lookahead = next(self._tokens, None)
+        return self._lookahead is not None
+
+    def next(self):
+        """Returns the next token. Raises StopIteration at the end."""
+        if not self.hasNext():
+            raise StopIteration("no more tokens")
+        token = self._lookahead
+        self._lookahead = None
+        return token
+
+    def __iter__(self):
+        """Iterates over the tokens that have not been read yet."""
+        if self._lookahead is not None:
+            yield self.next()
+        yield from self._tokens
@@ -0,0 +1,512 @@
+"""
+Name: Neel Srivastava
+Project: Sorting benchmark harness
+Date: 18/10/26
+Summary: Times the sorting algorithms from 3.4.py over several input shapes
+and a sweep of list sizes. Every (algorithm, distribution) sweep runs in its
+own worker process, each size is repeated and timed with perf_counter, and a
+sweep stops growing once an algorithm goes over the time budget, so the O(n^2)
+sorts do not hold up the whole run. Results are printed as a table and can be
+written to CSV and JSON files to compare runs across machines.
+
+Usage:
+    python sort_benchmark.py --sizes 100 1000 10000 --repeats 5 --csv out.csv --json out.json
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import time
+
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "nearly_sorted", "few_unique")
+
+# How an algorithm is called: on (arr, low, high), on a list, or on an
+# int64 NumPy array
+RANGE = "range"
+LIST = "list"
+NDARRAY = "ndarray"
+
+# Benchmark name -> (module, function, calling style)
+ALGORITHMS = {
+    "quick_sort": ("sorts", "quick_sort", RANGE),
+    "intro_sort": ("sorts", "intro_sort", RANGE),
+    "bubbleSort": ("sorts", "bubbleSort", LIST),
+    "insertionSort": ("sorts", "insertionSort", LIST),
+    "selectionSort": ("sorts", "selectionSort", LIST),
+    "radixSort": ("sorts", "radixSort", LIST),
+    "countingSort": ("sorts", "countingSort", LIST),
+    "naturalMergeSort": ("sorts", "naturalMergeSort", LIST),
+    "parallelSort": ("parallel_sort", "parallelSort", LIST),
+    "np.quicksort": ("numpy_sorts", "quickSort", NDARRAY),
+    "np.stable": ("numpy_sorts", "mergeSort", NDARRAY),
+    "np.heapsort": ("numpy_sorts", "heapSort", NDARRAY),
+    "np.partitionSort": ("numpy_sorts", "partitionSort", NDARRAY),
+    "np.radixSort": ("numpy_sorts", "radixSort", NDARRAY),
+}
+
+# Algorithms whose rows are compared against every other algorithm
+PARALLEL_ALGORITHMS = {
+    "parallelSort",
+}
+
+DEFAULT_SIZES = (100, 300, 1000, 3000, 10000)
+# Added to the default sizes when a parallel algorithm is selected, so its
+# pool actually starts (parallel_sort.PARALLEL_THRESHOLD is 100000); the time
+# budget stops the O(n^2) sorts long before these
+PARALLEL_SIZES = (100000, 300000)
+DEFAULT_REPEATS = 5
+DEFAULT_BUDGET = 1.0     # seconds for one run before a sweep stops growing
+DEFAULT_TIMEOUT = 120.0  # seconds to wait for one size before killing the worker
+
+# Same value range as the list built in 3.4.py
+LOW_VALUE = -200000
+HIGH_VALUE = 200000
+
+COUNT_FIELDS = ("comparisons", "swaps", "writes")
+FIELDS = ("algorithm", "distribution", "n", "repeats", "min", "median", "p95") + \
+         COUNT_FIELDS + ("workers", "status")
+
+
+def makeData(distribution, n, seed=0):
+    """
+    Builds a reproducible list of integers with the given shape.
+
+    :param distribution: One of DISTRIBUTIONS.
+    :param n: Number of items in the list.
+    :param seed: Extra seed so different runs can use different data.
+    :return: A new list of n integers.
+    :raises ValueError: If the distribution name is unknown.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("unknown distribution: " + str(distribution))
+    rng = random.Random("%s:%d:%d" % (distribution, n, seed))
+
+    if distribution == "few_unique":
+        values = [rng.randint(LOW_VALUE, HIGH_VALUE) for _ in range(10)]
+        return [rng.choice(values) for _ in range(n)]
+
+    data = [rng.randint(LOW_VALUE, HIGH_VALUE) for _ in range(n)]
+    if distribution == "random":
+        return data
+
+    data.sort()
+    if distribution == "reversed":
+        data.reverse()
+    elif distribution == "nearly_sorted" and n > 1:
+        # Swap about 1% of the positions so the list is almost in order
+        for _ in range(max(1, n // 100)):
+            i = rng.randrange(n)
+            j = rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+    return data
+
+
+def resolveAlgorithm(name):
+    """
+    Looks up a registered algorithm and wraps it so it takes a single list.
+
+    :param name: A key of ALGORITHMS.
+    :return: A function that sorts the list (or array) it is given in place.
+    :raises KeyError: If the algorithm is not registered.
+    """
+    moduleName, functionName, style = ALGORITHMS[name]
+    module = importlib.import_module(moduleName)
+
+    if style == RANGE:
+        def run(arr):
+            # Looked up on every call so later rebinding in the module is seen
+            getattr(module, functionName)(arr, 0, len(arr) - 1)
+        return run
+
+    def run(arr):
+        getattr(module, functionName)(arr)
+    return run
+
+
+def availableAlgorithms():
+    """
+    Lists the registered algorithms that can run here. The NumPy ones are
+    left out when NumPy is not installed.
+
+    :return: A list of algorithm names in registration order.
+    """
+    names = []
+    for name, (moduleName, functionName, style) in ALGORITHMS.items():
+        if style == NDARRAY:
+            import numpy_sorts
+            if not numpy_sorts.HAVE_NUMPY:
+                continue
+        names.append(name)
+    return names
+
+
+def summarize(times):
+    """
+    Reduces a list of timings to min, median, and 95th percentile.
+
+    :param times: A non-empty list of durations in seconds.
+    :return: A dict with "min", "median", and "p95" keys.
+    """
+    ordered = sorted(times)
+    rank = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {"min": ordered[0],
+            "median": statistics.median(ordered),
+            "p95": ordered[rank]}
+
+
+def _emptyRow(name, distribution, n, status):
+    """Returns a result row for a size that has no timings."""
+    return {"algorithm": name, "distribution": distribution, "n": n,
+            "repeats": 0, "min": None, "median": None, "p95": None,
+            "comparisons": None, "swaps": None, "writes": None,
+            "workers": None, "status": status}
+
+
+def countOperations(name, data):
+    """
+    Sorts one untimed copy of data with operation counting turned on.
+
+    :param name: A key of ALGORITHMS.
+    :param data: The list to copy and sort.
+    :return: A dict of comparisons, swaps and writes, or None if the
+             algorithm has no counted version.
+    """
+    moduleName = ALGORITHMS[name][0]
+    module = importlib.import_module(moduleName)
+    if name not in getattr(module, "COUNTED_ALGORITHMS", ()):
+        return None
+
+    wasCounting = module.counting
+    module.setCounting(True)
+    module.resetCounts()
+    try:
+        resolveAlgorithm(name)(list(data))
+    finally:
+        module.setCounting(wasCounting)
+    return dict(module.counts)
+
+
+def measure(run, name, distribution, n, repeats, seed=0, style=LIST, counts=True):
+    """
+    Times one algorithm on one input several times.
+
+    Each repeat sorts a fresh copy of the same data. The result of the last
+    repeat is checked outside of the timed section, and if counts is True
+    one more untimed run counts the operations.
+
+    :param run: A function that sorts a list in place.
+    :param name: The algorithm name used in the result row.
+    :param distribution: The input shape passed to makeData.
+    :param n: The list size.
+    :param repeats: How many timed runs to make.
+    :param seed: Seed passed to makeData.
+    :param style: NDARRAY to time on a NumPy array instead of a list.
+    :param counts: Whether to fill in the operation count columns.
+    :return: A result row dict with the keys in FIELDS.
+    :raises ValueError: If repeats is less than 1.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    row = _emptyRow(name, distribution, n, "ok")
+    row["repeats"] = repeats
+    if style == NDARRAY:
+        import numpy_sorts
+        data = numpy_sorts.makeArray(distribution, n, seed)
+        copy = data.copy
+        isCorrect = lambda arr: (arr == numpy_sorts.numpy.sort(data)).all()
+    else:
+        data = makeData(distribution, n, seed)
+        copy = data.copy
+        isCorrect = lambda arr: arr == sorted(data)
+
+    times = []
+    try:
+        for _ in range(repeats):
+            arr = copy()
+            start = time.perf_counter()
+            run(arr)
+            times.append(time.perf_counter() - start)
+    except Exception as error:
+        row["status"] = "error: " + type(error).__name__
+        return row
+
+    row.update(summarize(times))
+    if not isCorrect(arr):
+        row["status"] = "wrong result"
+    elif counts and style != NDARRAY:
+        row.update(countOperations(name, data) or {})
+    return row
+
+
+def workerCount(name, n):
+    """
+    Reports how many processes a parallel algorithm uses for n items.
+
+    :param name: A key of ALGORITHMS.
+    :param n: The list size.
+    :return: The process count from the module's chooseWorkers, 1 meaning
+             the single-process path, or None for an algorithm that is not
+             in PARALLEL_ALGORITHMS.
+    """
+    if name not in PARALLEL_ALGORITHMS:
+        return None
+    module = importlib.import_module(ALGORITHMS[name][0])
+    return module.chooseWorkers(n)
+
+
+def _sweepWorker(name, distribution, sizes, repeats, budget, seed, counts, connection):
+    """
+    Worker process body. Sends one row per size, in order, and marks the
+    remaining sizes as skipped once a run fails or goes over the budget.
+    """
+    run = resolveAlgorithm(name)
+    style = ALGORITHMS[name][2]
+    overBudget = False
+    for n in sizes:
+        if overBudget:
+            row = _emptyRow(name, distribution, n, "skipped")
+        else:
+            row = measure(run, name, distribution, n, repeats, seed, style, counts)
+            row["workers"] = workerCount(name, n)
+            overBudget = row["status"] != "ok" or row["min"] > budget
+        connection.send(row)
+    connection.close()
+
+
+def runSweep(name, distribution, sizes, repeats=DEFAULT_REPEATS,
+             budget=DEFAULT_BUDGET, timeout=DEFAULT_TIMEOUT, seed=0, counts=True):
+    """
+    Runs one algorithm over all sizes of one distribution in a worker process.
+
+    If the worker does not report a size within timeout seconds it is killed,
+    that size is marked as a timeout, and the larger sizes are skipped.
+
+    :return: A list of result rows, one per size.
+    """
+    # Not a daemon process, because parallel sorts start their own pools
+    context = multiprocessing.get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_sweepWorker,
+                              args=(name, distribution, list(sizes), repeats,
+                                    budget, seed, counts, sender))
+    process.start()
+    sender.close()
+
+    rows = []
+    while len(rows) < len(sizes):
+        if not receiver.poll(timeout):
+            status = "timeout"
+        else:
+            try:
+                rows.append(receiver.recv())
+                continue
+            except EOFError:
+                status = "error: worker exited"
+        process.kill()
+        for missing in sizes[len(rows):]:
+            rows.append(_emptyRow(name, distribution, missing, status))
+            status = "skipped"
+        break
+
+    receiver.close()
+    process.join()
+    return rows
+
+
+def runBenchmark(algorithms=None, distributions=DISTRIBUTIONS,
+                 sizes=DEFAULT_SIZES, repeats=DEFAULT_REPEATS,
+                 budget=DEFAULT_BUDGET, timeout=DEFAULT_TIMEOUT, seed=0,
+                 counts=True, verbose=True):
+    """
+    Runs every (algorithm, distribution) sweep one after another.
+
+    Sweeps are not run at the same time so they do not compete for the CPU.
+
+    :return: A list of result rows for all algorithms, distributions, and sizes.
+    :raises ValueError: If repeats is less than 1.
+    """
+    # Checked here too, so a bad value is not reported as a worker crash
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    if algorithms is None:
+        algorithms = availableAlgorithms()
+    sizes = sorted(sizes)
+    rows = []
+    for name in algorithms:
+        for distribution in distributions:
+            sweep = runSweep(name, distribution, sizes, repeats, budget,
+                             timeout, seed, counts)
+            if verbose:
+                for row in sweep:
+                    print(formatRow(row), flush=True)
+            rows.extend(sweep)
+    return rows
+
+
+def _formatSeconds(value):
+    return "-" if value is None else "%.6f" % value
+
+
+def _formatCount(value):
+    return "-" if value is None else str(value)
+
+
+def formatRow(row):
+    """Returns one result row as a fixed-width line of text."""
+    return "%-16s %-14s %9d %12s %12s %12s %13s %13s %13s  %s" % (
+        row["algorithm"], row["distribution"], row["n"],
+        _formatSeconds(row["min"]), _formatSeconds(row["median"]),
+        _formatSeconds(row["p95"]), _formatCount(row.get("comparisons")),
+        _formatCount(row.get("swaps")), _formatCount(row.get("writes")),
+        row["status"])
+
+
+def formatTable(rows):
+    """Returns all result rows as a table with a header line."""
+    header = "%-16s %-14s %9s %12s %12s %12s %13s %13s %13s  %s" % (
+        "algorithm", "distribution", "n", "min (s)", "median (s)", "p95 (s)",
+        "comparisons", "swaps", "writes", "status")
+    return "\n".join([header, "-" * len(header)] + [formatRow(row) for row in rows])
+
+
+def speedups(rows, name):
+    """
+    Compares one algorithm with every other algorithm at the same
+    distribution and size, using the median times.
+
+    :param rows: Result rows from runBenchmark.
+    :param name: The algorithm to compare, usually a parallel one.
+    :return: A list of (distribution, n, other algorithm, speedup, workers)
+             tuples, where speedup is other median / name median and workers
+             is the process count name used at that size (None if unknown).
+    """
+    medians = {}
+    workers = {}
+    for row in rows:
+        if row["status"] == "ok":
+            key = (row["algorithm"], row["distribution"], row["n"])
+            medians[key] = row["median"]
+            workers[key] = row.get("workers")
+
+    results = []
+    for (algorithm, distribution, n), median in medians.items():
+        if algorithm == name or median == 0:
+            continue
+        target = medians.get((name, distribution, n))
+        if target:
+            results.append((distribution, n, algorithm, median / target,
+                            workers[(name, distribution, n)]))
+    results.sort()
+    return results
+
+
+def formatSpeedups(rows, name):
+    """Returns the speedups of one algorithm as a table, or "" if there are none."""
+    results = speedups(rows, name)
+    if not results:
+        return ""
+    header = "%-14s %9s %-16s %10s %8s" % ("distribution", "n", "versus", "speedup", "workers")
+    lines = ["Speedup of " + name, header, "-" * len(header)]
+    for distribution, n, algorithm, ratio, workers in results:
+        # With one process the pool never started, so this is not a
+        # multi-core speedup
+        note = "  single process" if workers == 1 else ""
+        lines.append("%-14s %9d %-16s %9.2fx %8s%s" % (
+            distribution, n, algorithm, ratio, _formatCount(workers), note))
+    return "\n".join(lines)
+
+
+def machineInfo():
+    """Describes the machine so saved results can be compared across machines."""
+    return {"python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def writeCsv(rows, path):
+    """Writes result rows to a CSV file with one column per field."""
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def writeJson(rows, path, settings=None):
+    """Writes result rows to a JSON file along with machine details."""
+    document = {"machine": machineInfo(), "settings": settings or {}, "results": rows}
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def main(argv=None):
+    """
+    Parses the command line, runs the benchmark, and saves the results.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms from 3.4.py.")
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS),
+                        default=availableAlgorithms())
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        help="list sizes (default %s, plus %s when a parallel "
+                             "algorithm is selected)" % (DEFAULT_SIZES, PARALLEL_SIZES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="stop growing a sweep once one run takes longer than this (s)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="kill a worker that spends longer than this on one size (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-counts", dest="counts", action="store_false",
+                        help="skip the extra run that counts comparisons, swaps and writes")
+    parser.add_argument("--csv", help="write the results to this CSV file")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    available = availableAlgorithms()
+    skipped = [name for name in args.algorithms if name not in available]
+    if skipped:
+        print("Skipping (NumPy is not installed):", ", ".join(skipped))
+        args.algorithms = [name for name in args.algorithms if name in available]
+    if args.sizes is None:
+        args.sizes = list(DEFAULT_SIZES)
+        if PARALLEL_ALGORITHMS.intersection(args.algorithms):
+            args.sizes += PARALLEL_SIZES
+
+    rows = runBenchmark(args.algorithms, args.distributions, args.sizes,
+                        args.repeats, args.budget, args.timeout, args.seed,
+                        args.counts, verbose=False)
+    print(formatTable(rows))
+    for name in args.algorithms:
+        if name in PARALLEL_ALGORITHMS:
+            table = formatSpeedups(rows, name)
+            if table:
+                print()
+                print(table)
+
+    if args.csv:
+        writeCsv(rows, args.csv)
+    if args.json:
+        settings = {key: value for key, value in vars(args).items()
+                    if key not in ("csv", "json")}
+        writeJson(rows, args.json, settings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+Name: Neel Srivastava
+Project: Importable sorting module
+Date: 18/10/26
+Summary: 3.4.py cannot be imported with a normal import statement because its
+name starts with a digit. This module runs 3.4.py inside its own namespace so
+other files (and worker processes, which look functions up by module name)
+can use "import sorts" and reach quick_sort, bubbleSort, and the rest.
+"""
+
+import os
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "3.4.py")
+
+with open(SOURCE_PATH) as _source:
+    exec(compile(_source.read(), SOURCE_PATH, "exec"), globals())
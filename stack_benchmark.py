@@ -0,0 +1,117 @@
+"""
+Name: Neel Srivastava
+Project: Stack micro-benchmark
+Date: 18/10/26
+Summary: Compares the list-based Stack in palindrome.py with CompactStack:
+one push and one pop per item through each class, the bulk push_many and
+drain calls, and the character array backend. It also reports how many
+bytes each stack holds for the same characters, and times isPalindrome
+against the old one-character-at-a-time Stack version.
+
+Usage:
+    python stack_benchmark.py --items 100000 --repeats 5
+"""
+
+import argparse
+import sys
+import timeit
+
+from palindrome import CHAR_TYPECODE, CompactStack, Stack, isPalindrome
+
+
+DEFAULT_ITEMS = 100000
+DEFAULT_REPEATS = 5
+
+
+def pushPop(stack, items):
+    """Pushes every item, then pops until the stack is empty."""
+    for item in items:
+        stack.push(item)
+    while not stack.is_empty():
+        stack.pop()
+
+
+def bulkPushPop(stack, items):
+    """Pushes every item with push_many, then drains the stack."""
+    stack.push_many(items)
+    stack.drain()
+
+
+def stackPalindrome(text):
+    """isPalindrome exactly as it was with the list Stack: one push and one
+    pop per character, building the reverse with +=, kept here as the
+    baseline."""
+    cleaned = "".join(ch.lower() for ch in text if ch.isalnum())
+
+    if len(cleaned) == 0:
+        return True
+
+    stack = Stack()
+    for ch in cleaned:
+        stack.push(ch)
+
+    reversed_str = ""
+    while not stack.is_empty():
+        reversed_str += stack.pop()
+
+    return cleaned == reversed_str
+
+
+def stackBytes(stack):
+    """Returns the bytes held by a stack's storage. For a list this counts
+    one pointer per item plus each distinct item object once (one-character
+    strings are shared, so a repeated character costs only its pointer)."""
+    data = stack._data
+    size = sys.getsizeof(data)
+    if isinstance(data, list):
+        unique = {id(item): item for item in data}
+        size += sum(sys.getsizeof(item) for item in unique.values())
+    return size
+
+
+def makeCases(text):
+    """Returns the timed cases as a dict from name to a function of no
+    arguments."""
+    return {
+        "Stack push/pop": lambda: pushPop(Stack(), text),
+        "CompactStack push/pop": lambda: pushPop(CompactStack(), text),
+        "CompactStack(%r) push/pop" % CHAR_TYPECODE: lambda: pushPop(CompactStack(CHAR_TYPECODE), text),
+        "CompactStack push_many/drain": lambda: bulkPushPop(CompactStack(), text),
+        "CompactStack(%r) push_many/drain" % CHAR_TYPECODE:
+            lambda: bulkPushPop(CompactStack(CHAR_TYPECODE), text),
+        "isPalindrome (old Stack)": lambda: stackPalindrome(text),
+        "isPalindrome (CompactStack)": lambda: isPalindrome(text),
+    }
+
+
+def main(argv=None):
+    """
+    Parses the command line and prints the timings and storage sizes.
+
+    :param argv: Argument list, or None to use sys.argv.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the palindrome stacks.")
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEMS)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args(argv)
+
+    half = "".join(chr(ord("a") + i % 26) for i in range(args.items // 2))
+    text = half + half[::-1]
+
+    print("%-36s %12s %10s" % ("case", "min (s)", "ns/item"))
+    for name, case in makeCases(text).items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeats))
+        print("%-36s %12.6f %10.1f" % (name, best, 1e9 * best / len(text)))
+
+    print()
+    listStack = Stack()
+    for ch in text:
+        listStack.push(ch)
+    print("%-36s %12d" % ("Stack bytes", stackBytes(listStack)))
+    print("%-36s %12d" % ("CompactStack(%r) bytes" % CHAR_TYPECODE,
+                          stackBytes(CompactStack(CHAR_TYPECODE, text))))
+
+
+if __name__ == "__main__":
+    main()
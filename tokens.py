@@ -0,0 +1,90 @@
+"""
+Name: Neel Srivastava
+Project: Tokens for the infix-to-postfix converter
+Date: 18/10/26
+Summary: Defines the Token class used by scanner.py and converter.py. Every
+token stores an integer kind code and its precedence when it is made, so the
+converter can compare numbers instead of building strings. There is only one
+Token object for each operator and parenthesis (Token.OPERATORS), which the
+scanner hands out again and again.
+"""
+
+
+class Token(object):
+    """One token of an infix expression: an integer or an operator."""
+
+    __slots__ = ("kind", "value", "precedence", "rightAssoc")
+
+    # Kind codes; operands come first so one comparison finds them
+    UNKNOWN = 0
+    INT = 1
+    VAR = 2
+    LPAR = 3
+    RPAR = 4
+    PLUS = 5
+    MINUS = 6
+    MUL = 7
+    DIV = 8
+    MOD = 9
+    EXP = 10
+    # Every kind from INT to LAST_OPERAND is an operand
+    LAST_OPERAND = VAR
+    # Every kind from FIRST_OP up is a binary operator
+    FIRST_OP = PLUS
+
+    # Symbol -> kind
+    KINDS = {"(": LPAR, ")": RPAR, "+": PLUS, "-": MINUS, "*": MUL,
+             "/": DIV, "%": MOD, "^": EXP}
+
+    # Kind -> precedence; parentheses get 0 so no operator ever pops them
+    PRECEDENCE = {UNKNOWN: 0, INT: 0, VAR: 0, LPAR: 0, RPAR: 0, PLUS: 1, MINUS: 1,
+                  MUL: 2, DIV: 2, MOD: 2, EXP: 3}
+
+    def __init__(self, value):
+        """Makes a token for an int, an identifier (a variable) or one of
+        the symbols in KINDS. Anything else gets the UNKNOWN kind."""
+        if type(value) == int:
+            self.kind = Token.INT
+        elif value in Token.KINDS:
+            self.kind = Token.KINDS[value]
+        elif isinstance(value, str) and value.isidentifier():
+            self.kind = Token.VAR
+        else:
+            self.kind = Token.UNKNOWN
+        self.value = value
+        self.precedence = Token.PRECEDENCE[self.kind]
+        # 2 ^ 3 ^ 2 is 2 ^ (3 ^ 2)
+        self.rightAssoc = self.kind == Token.EXP
+
+    def isOperand(self):
+        """Returns True if the token is a number or a variable."""
+        return Token.INT <= self.kind <= Token.LAST_OPERAND
+
+    def isOperator(self):
+        """Returns True if the token is a binary operator."""
+        return self.kind >= Token.FIRST_OP
+
+    def getType(self):
+        """Returns the kind code of the token."""
+        return self.kind
+
+    def getValue(self):
+        """Returns the int, variable name or symbol the token was made from."""
+        return self.value
+
+    def getPrecedence(self):
+        """Returns the precedence, higher binding tighter, 0 for operands
+        and parentheses."""
+        return self.precedence
+
+    def __str__(self):
+        """Returns the token as it was written."""
+        return str(self.value)
+
+    def __repr__(self):
+        """Returns a Token(...) form for debugging."""
+        return "Token(%r)" % (self.value,)
+
+
+# The one shared token for each operator and parenthesis
+Token.OPERATORS = {symbol: Token(symbol) for symbol in Token.KINDS}